@@ -0,0 +1,61 @@
+"""Fill throughput of the vectorized broker simulator.
+
+python benchmarks/bench_fills.py --orders 1000000 --symbols 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from trading.fills import BUY, SELL, BatchBroker, FillModel, TradeLog  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--orders", type=int, default=1_000_000)
+    ap.add_argument("--symbols", type=int, default=5_000)
+    ap.add_argument("--batches", type=int, default=5)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    n = args.orders
+    sid = rng.integers(0, args.symbols, n)
+    side = np.where(rng.random(n) < 0.55, BUY, SELL).astype(np.int8)
+    qty = rng.uniform(1, 100, n)
+    px = rng.uniform(10, 500, n)
+    avail = rng.uniform(50, 500, n)
+
+    broker = BatchBroker(
+        capacity=args.symbols, model=FillModel(slippage_bps=2.0), log=TradeLog(1 << 20)
+    )
+    broker.submit_batch(sid, side, qty, px, avail)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(args.batches):
+        broker.submit_batch(sid, side, qty, px, avail)
+    dt = time.perf_counter() - t0
+    print(
+        f"{args.batches * n / dt / 1e6:.2f}M fills/s ({n:,} orders/batch, {args.symbols:,} symbols)"
+    )
+    t0 = time.perf_counter()
+    equity = broker.mark_to_market(rng.uniform(10, 500, args.symbols))
+    print(f"mark-to-market: {(time.perf_counter() - t0) * 1e3:.2f} ms, equity {equity:,.0f}")
+
+    single = min(n, 100_000)
+    t0 = time.perf_counter()
+    orders = zip(sid.tolist(), side.tolist(), qty.tolist(), px.tolist(), strict=True)
+    for s, d, q, p in itertools.islice(orders, single):
+        broker.submit_one(s, d, q, p)
+    dt = time.perf_counter() - t0
+    print(f"single orders: {dt / single * 1e6:.2f} us/order")
+
+
+if __name__ == "__main__":
+    main()
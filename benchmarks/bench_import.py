@@ -0,0 +1,53 @@
+"""Cold-start import benchmark.
+
+Each module is imported in a fresh interpreter so nothing is shared through
+``sys.modules``; the best of ``--repeat`` runs is reported.
+
+    python benchmarks/bench_import.py --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+MODULES = [
+    "entropy_cli.backtest",
+    "entropy_cli.service",
+    "entropy.analyzer",
+    "trading.backtest",
+    "services.api",
+]
+_PROBE = "import time; t=time.perf_counter(); import {mod}; print(time.perf_counter()-t)"
+
+
+def time_import(module: str, repeat: int) -> float:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(mod=module)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        best = min(best, float(out.stdout.strip().splitlines()[-1]))
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("modules", nargs="*", default=MODULES)
+    args = ap.parse_args()
+    for mod in args.modules:
+        print(f"{mod:<24} {time_import(mod, args.repeat) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Encoding throughput of the price WebSocket wire formats, on one core.
+
+"legacy" is the original per-tick ``send_json`` payload; the others go through
+``services.wire.TickEncoder``. Frames/s bounds per-message socket overhead.
+
+python benchmarks/bench_wire.py --ticks 200000 --batch 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from market.types import MarketTick  # noqa: E402
+from services.wire import TickEncoder  # noqa: E402
+
+SYMBOLS = ["SPY", "QQQ", "VTI", "BTC-USD", "ETH-USD"]
+
+
+def _legacy(ticks: list[MarketTick]) -> list[str]:
+    return [
+        json.dumps(
+            {"symbol": t.symbol, "ts": t.ts.isoformat(), "price": t.price},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        for t in ticks
+    ]
+
+
+def _run(name: str, encode, ticks: list[MarketTick]) -> None:
+    t0 = time.perf_counter()
+    frames = encode(ticks)
+    dt = time.perf_counter() - t0
+    size = sum(len(f.encode() if isinstance(f, str) else f) for f in frames)
+    print(
+        f"{name:<16} {len(ticks) / dt / 1e6:6.2f}M ticks/s {size / dt / 1e6:8.1f} MB/s "
+        f"{len(frames) / dt / 1e3:9.1f}k frames/s {size / len(ticks):6.1f} B/tick"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ticks", type=int, default=200_000)
+    ap.add_argument("--batch", type=int, default=64)
+    args = ap.parse_args()
+
+    t0 = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+    ticks = [
+        MarketTick(SYMBOLS[i % 5], t0 + timedelta(microseconds=i), 100.0 + i * 1e-3, "simulated")
+        for i in range(args.ticks)
+    ]
+    b = args.batch
+    for fmt in ("json", "binary"):
+        enc = TickEncoder(SYMBOLS, fmt)
+        if fmt == "json":
+            _run("legacy json", _legacy, ticks)
+        _run(f"{fmt} per-tick", lambda ts, e=enc: [e.encode_one(t) for t in ts], ticks)
+        _run(
+            f"{fmt} batch={b}",
+            lambda ts, e=enc: [e.encode(ts[i : i + b]) for i in range(0, len(ts), b)],
+            ticks,
+        )
+
+
+if __name__ == "__main__":
+    main()
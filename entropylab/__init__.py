@@ -8,12 +8,14 @@ Usage
 >>> # prices = pd.Series([...])  # daily close prices
 >>> result = backtest(prices)
 >>> print(result["sharpe"])
+>>> # prices_wide = pd.DataFrame({...})  # one column per asset
+>>> table = backtest(prices_wide)  # one row of metrics per asset
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional
+from typing import Dict, Optional, Union, overload
 
 import numpy as np
 import pandas as pd
@@ -34,12 +36,12 @@ class BacktestResult:
         return asdict(self)
 
 
-def _annualization_factor(prices: pd.Series) -> float:
+def _annualization_factor(index: pd.Index) -> float:
     """Infer periods per year from the index frequency; default to 252 (daily)."""
-    if isinstance(prices.index, pd.DatetimeIndex):
+    if isinstance(index, pd.DatetimeIndex):
         try:
             # If a proper freq exists, map common ones
-            freq = prices.index.inferred_freq or prices.index.freqstr
+            freq = index.inferred_freq or index.freqstr
             if freq:
                 f = freq.upper()
                 if "B" in f or "D" in f:  # business/daily
@@ -58,78 +60,222 @@ def _annualization_factor(prices: pd.Series) -> float:
     return 252.0
 
 
+def _column_factors(frame: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+    """Periods per year for each column, inferred from that column's own non-NaN index.
+
+    Columns without gaps share the frame index, so only gappy columns are inferred
+    one by one (once per distinct gap pattern); this keeps each column equal to
+    ``backtest(frame[col])``.
+    """
+    index = frame.index
+    factors = np.full(frame.shape[1], _annualization_factor(index))
+    if isinstance(index, pd.DatetimeIndex):
+        seen: Dict[bytes, float] = {}
+        for j in np.flatnonzero(~valid.all(axis=0)):
+            mask = valid[:, j]
+            key = np.packbits(mask).tobytes()
+            if key not in seen:
+                seen[key] = _annualization_factor(index[mask])
+            factors[j] = seen[key]
+    return factors
+
+
+def _score_block(
+    values: np.ndarray,
+    valid: Optional[np.ndarray],
+    index: pd.Index,
+    periods_per_year: np.ndarray,
+    risk_free_annual: float,
+) -> Dict[str, np.ndarray]:
+    """Score every column of ``values``; ``valid`` is None when the block has no NaNs.
+
+    ``periods_per_year`` holds one annualization factor per column.
+    """
+    t, n = values.shape
+    cols = np.arange(n)
+    complete = valid is None
+    if valid is None:
+        n_valid = np.full(n, t)
+        first = np.zeros(n, dtype=int)
+        last = np.full(n, t - 1)
+        filled = values
+    else:
+        n_valid = valid.sum(axis=0)
+        first = valid.argmax(axis=0)
+        last = t - 1 - valid[::-1].argmax(axis=0)
+        # Forward-fill through gaps so each return after a gap spans it.
+        src = np.where(valid, np.arange(t)[:, None], 0)
+        np.maximum.accumulate(src, axis=0, out=src)
+        filled = values[src, cols]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rets = filled[1:] / filled[:-1] - 1.0
+        # Drawdown on the NAV from the first return onwards (the entry price is not a peak).
+        curve = filled[1:].copy()
+        if valid is not None:
+            rets[~valid[1:]] = np.nan
+            curve[~valid[1:]] = np.nan
+            curve[np.maximum(first - 1, 0), cols] = np.where(first > 0, np.nan, curve[0])
+            rets = np.where(np.isfinite(rets), rets, 0.0)
+        n_rets = n_valid - 1
+        mean = rets.sum(axis=0) / n_rets
+        sumsq = np.einsum("ij,ij->j", rets, rets)
+        vol = np.sqrt(np.maximum(sumsq - n_rets * mean**2, 0.0) / (n_rets - 1))
+        rf_per_period = (1 + risk_free_annual) ** (1 / periods_per_year) - 1
+        sharpe = np.where(vol > 0, (mean - rf_per_period) / vol * np.sqrt(periods_per_year), 0.0)
+
+        running_max = np.maximum if complete else np.fmax  # fmax skips the NaN gaps
+        np.divide(curve, running_max.accumulate(curve, axis=0), out=curve)
+        max_dd = np.fmin.reduce(curve, axis=0) - 1.0
+
+        growth = values[last, cols] / values[first, cols]
+        if isinstance(index, pd.DatetimeIndex) and index.size > 1:
+            days = np.asarray((index[last] - index[first]).days)
+            years = np.where(days > 0, days, 1) / 365.25
+        else:
+            years = np.maximum(n_valid / periods_per_year, 1e-9)
+        cagr = growth ** (1 / years) - 1
+
+    too_short = n_valid < 3
+    return {
+        "sharpe": np.where(too_short, 0.0, np.round(sharpe, 4)),
+        "cagr": np.where(too_short, 0.0, np.round(cagr, 6)),
+        "total_return": np.where(too_short, 0.0, np.round(growth - 1, 6)),
+        "max_drawdown": np.where(too_short, 0.0, np.round(max_dd, 6)),
+        "trades": np.zeros(n, dtype=int),
+    }
+
+
+def _score_matrix(
+    values: np.ndarray,
+    index: pd.Index,
+    periods_per_year: np.ndarray,
+    risk_free_annual: float,
+) -> Dict[str, np.ndarray]:
+    """Buy-and-hold metrics for every column of a (bars x assets) price matrix.
+
+    Each column matches the single-series result on its own ``dropna()`` prices:
+    NaNs are skipped and a return spanning a gap is measured from the last valid price.
+    Columns without NaNs take a cheaper path than the gappy ones.
+    """
+    valid = np.isfinite(values)
+    gappy = ~valid.all(axis=0)
+    ppy = periods_per_year
+    if not gappy.any():
+        return _score_block(values, None, index, ppy, risk_free_annual)
+    if gappy.all():
+        return _score_block(values, valid, index, ppy, risk_free_annual)
+    clean = _score_block(values[:, ~gappy], None, index, ppy[~gappy], risk_free_annual)
+    holes = _score_block(values[:, gappy], valid[:, gappy], index, ppy[gappy], risk_free_annual)
+    out = {}
+    for key, arr in clean.items():
+        merged = np.empty(values.shape[1], dtype=arr.dtype)
+        merged[~gappy] = arr
+        merged[gappy] = holes[key]
+        out[key] = merged
+    return out
+
+
+@overload
+def backtest(
+    prices: np.ndarray,
+    risk_free_annual: float = ...,
+    plot: bool = ...,
+    verbose: bool = ...,
+) -> Union[Dict[str, float], pd.DataFrame]: ...  # dict for 1-D, DataFrame for 2-D
+
+
+@overload
 def backtest(
     prices: pd.Series,
+    risk_free_annual: float = ...,
+    plot: bool = ...,
+    verbose: bool = ...,
+) -> Dict[str, float]: ...
+
+
+# Without pandas stubs Series and DataFrame are both Any, so mypy sees these two as overlapping.
+@overload
+def backtest(  # type: ignore[overload-cannot-match]
+    prices: pd.DataFrame,
+    risk_free_annual: float = ...,
+    plot: bool = ...,
+    verbose: bool = ...,
+) -> pd.DataFrame: ...
+
+
+def backtest(
+    prices: Union[pd.Series, pd.DataFrame, np.ndarray],
     risk_free_annual: float = 0.0,
     plot: bool = False,
-) -> Dict[str, float]:
+    verbose: bool = False,
+) -> Union[Dict[str, float], pd.DataFrame]:
     """
     Minimal, opinionated backtest:
-    - Strategy: long-and-hold the input price series
+    - Strategy: long-and-hold each input price series
     - Outputs: Sharpe (excess), CAGR, Total Return, Max Drawdown, Trades (0)
 
     Parameters
     ----------
-    prices : pd.Series
-        Close prices indexed by datetime (preferred) or ordinal index.
+    prices : pd.Series, pd.DataFrame or np.ndarray
+        Close prices indexed by datetime (preferred) or ordinal index. A Series
+        (or 1-D array) is one asset; a wide DataFrame (or 2-D array, bars x assets)
+        scores every column at once.
     risk_free_annual : float
         Annualized risk-free rate (e.g., 0.02 for 2%). Default 0.
     plot : bool
         If True, show NAV chart (requires matplotlib; it’s in install_requires).
+    verbose : bool
+        If True, print a one-line summary.
 
     Returns
     -------
-    dict
-        {"sharpe", "cagr", "total_return", "max_drawdown", "trades"}
+    dict or pd.DataFrame
+        {"sharpe", "cagr", "total_return", "max_drawdown", "trades"} for a single
+        series; otherwise a DataFrame with those columns, one row per asset.
     """
-    if not isinstance(prices, pd.Series):
-        raise TypeError("prices must be a pandas Series of close prices")
-
-    prices = prices.dropna().astype(float)
-    if prices.size < 3:
-        return BacktestResult(sharpe=0.0, cagr=0.0, total_return=0.0, max_drawdown=0.0, trades=0).to_dict()
-
-    rets = prices.pct_change().dropna()
-    periods_per_year = _annualization_factor(prices)
-    rf_per_period = (1 + risk_free_annual) ** (1 / periods_per_year) - 1
-
-    excess = rets - rf_per_period
-    vol = excess.std()
-    sharpe = float((excess.mean() / vol) * np.sqrt(periods_per_year)) if vol > 0 else 0.0
-
-    nav = (1 + rets).cumprod()
-    total_return = float(nav.iloc[-1] - 1)
-
-    # Max drawdown
-    roll_max = nav.cummax()
-    drawdown = nav / roll_max - 1.0
-    max_dd = float(drawdown.min())
-
-    # CAGR (robust to irregular spacing by using time delta if datetime)
-    if isinstance(prices.index, pd.DatetimeIndex) and prices.index.size > 1:
-        days = (prices.index[-1] - prices.index[0]).days or 1
-        years = days / 365.25
-        cagr = float((prices.iloc[-1] / prices.iloc[0]) ** (1 / years) - 1) if years > 0 else 0.0
-    else:
-        years = max(len(prices) / periods_per_year, 1e-9)
-        cagr = float((prices.iloc[-1] / prices.iloc[0]) ** (1 / years) - 1)
+    if isinstance(prices, np.ndarray):
+        if prices.ndim not in (1, 2):
+            raise TypeError("price arrays must be 1-D (one asset) or 2-D (bars x assets)")
+        prices = pd.Series(prices) if prices.ndim == 1 else pd.DataFrame(prices)
+    if not isinstance(prices, (pd.Series, pd.DataFrame)):
+        raise TypeError("prices must be a pandas Series/DataFrame or a NumPy array of close prices")
+
+    single = isinstance(prices, pd.Series)
+    frame = prices.dropna().to_frame() if single else prices
+    frame = frame.astype(float)
+    values = frame.to_numpy()
+    periods_per_year = _column_factors(frame, np.isfinite(values))
+    scores = _score_matrix(values, frame.index, periods_per_year, risk_free_annual)
+    table = pd.DataFrame(scores, index=frame.columns)
 
     if plot:
         # Lazy import to keep import time snappy
         import matplotlib.pyplot as plt  # noqa: WPS433 (runtime import)
 
-        ax = nav.rename("NAV").plot(title="EntropyLab Backtest — Buy & Hold")
+        nav = frame.ffill() / frame.bfill().iloc[0]
+        ax = nav.plot(title="EntropyLab Backtest — Buy & Hold", legend=frame.shape[1] <= 10)
         ax.set_xlabel("Date")
         ax.set_ylabel("NAV (normalized)")
         plt.show()
 
+    if not single:
+        if verbose:
+            print(
+                f"Scored {len(table)} assets (entropylab) | median Sharpe: "
+                f"{table['sharpe'].median():.2f} | median CAGR: {table['cagr'].median():.2%}"
+            )
+        return table
+
+    row = table.iloc[0]
     result = BacktestResult(
-        sharpe=round(sharpe, 4),
-        cagr=round(cagr, 6),
-        total_return=round(total_return, 6),
-        max_drawdown=round(max_dd, 6),
+        sharpe=float(row["sharpe"]),
+        cagr=float(row["cagr"]),
+        total_return=float(row["total_return"]),
+        max_drawdown=float(row["max_drawdown"]),
         trades=0,
     )
-    # Print a nice one-liner for the Quickstart notebook UX
-    print(f"Sharpe (entropylab): {result.sharpe:.2f} | CAGR: {result.cagr:.2%} | MaxDD: {result.max_drawdown:.2%}")
+    if verbose:
+        # One-liner for the Quickstart notebook UX
+        print(f"Sharpe (entropylab): {result.sharpe:.2f} | CAGR: {result.cagr:.2%} | MaxDD: {result.max_drawdown:.2%}")
     return result.to_dict()
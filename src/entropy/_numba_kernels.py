@@ -0,0 +1,70 @@
+"""Numba-compiled entropy kernels; imported only by the ``numba`` backend."""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def rolling_delta_phi(prices, window):
+    n = prices.size
+    out = np.full(n, np.nan)
+    for i in numba.prange(window - 1, n):
+        hi = prices[i - window + 1]
+        lo = hi
+        for k in range(i - window + 2, i + 1):
+            v = prices[k]
+            if v > hi:
+                hi = v
+            if v < lo:
+                lo = v
+        out[i] = (hi - lo) / max(abs(hi), 1e-9)
+    return out
+
+
+@numba.njit(parallel=True, cache=True)
+def rolling_no_recovery(dphi, window, p_threshold):
+    n = dphi.size
+    out = np.zeros(n, dtype=np.bool_)
+    for i in numba.prange(window - 1, n):
+        lo = np.inf
+        seen = False
+        for k in range(i - window + 1, i + 1):
+            v = dphi[k]
+            if np.isfinite(v):
+                seen = True
+                if v < lo:
+                    lo = v
+        out[i] = seen and lo >= p_threshold
+    return out
+
+
+@numba.njit(parallel=True, cache=True)
+def rolling_slope(prices, window):
+    n = prices.size
+    out = np.full(n, np.nan)
+    xbar = (window - 1) / 2.0
+    var = (window * window - 1) / 12.0
+    for i in numba.prange(window - 1, n):
+        acc = 0.0
+        start = i - window + 1
+        for k in range(window):
+            acc += (k - xbar) * prices[start + k]
+        out[i] = (acc / window) / (var + 1e-12)
+    return out
+
+
+@numba.njit(cache=True)
+def position_scan(trigger, direction, hold):
+    n = trigger.size
+    pos = np.zeros(n)
+    last = -1
+    d = 0.0
+    for j in range(n):
+        if trigger[j]:
+            last = j
+            d = direction[j]
+        if last >= 0 and j - last < hold:
+            pos[j] = d
+    return pos
@@ -4,12 +4,15 @@ import hashlib
 import json
 import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import numpy as np
-from proof.capsule import CapsuleModel, EntropySignalModel
 
 from .metrics import rolling_delta_phi
 
+if TYPE_CHECKING:
+    from proof.capsule import CapsuleModel
+
 
 @dataclass(frozen=True)
 class EntropySignal:
@@ -95,6 +98,9 @@ class EntropyAnalyzer:
         }
         from time import time_ns
 
+        # Deferred so analysis-only callers (CLI backtests) never import pydantic.
+        from proof.capsule import CapsuleModel, EntropySignalModel
+
         return CapsuleModel(
             signal_hash=signal_hash,
             timestamp_ns=time_ns(),
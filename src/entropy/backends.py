@@ -0,0 +1,209 @@
+"""Pluggable compute backends for the entropy kernels.
+
+Every backend takes and returns host NumPy arrays, so callers never see device
+arrays or pay per-element transfers. Backends whose dependency is missing are
+simply unavailable. ``get_backend("auto")`` picks the fastest available one by
+timing the kernels once per process, so it is opt-in: short-lived jobs should
+name a backend (NumPy is the default everywhere).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from functools import cache
+from typing import Any, Protocol
+
+import numpy as np
+from utils.arrays import to_numpy, xp
+
+from . import metrics
+
+
+class KernelBackend(Protocol):
+    name: str
+
+    def rolling_delta_phi(self, prices: np.ndarray, window: int) -> np.ndarray: ...
+
+    def rolling_no_recovery(
+        self, dphi: np.ndarray, window: int, p_threshold: float
+    ) -> np.ndarray: ...
+
+    def rolling_slope(self, prices: np.ndarray, window: int) -> np.ndarray: ...
+
+    def position_scan(
+        self, trigger: np.ndarray, direction: np.ndarray, hold: int
+    ) -> np.ndarray: ...
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def rolling_delta_phi(self, prices: np.ndarray, window: int) -> np.ndarray:
+        return metrics.rolling_delta_phi(prices, window)
+
+    def rolling_no_recovery(self, dphi: np.ndarray, window: int, p_threshold: float) -> np.ndarray:
+        return metrics.rolling_no_recovery(dphi, window, p_threshold)
+
+    def rolling_slope(self, prices: np.ndarray, window: int) -> np.ndarray:
+        return metrics.rolling_slope(prices, window)
+
+    def position_scan(self, trigger: np.ndarray, direction: np.ndarray, hold: int) -> np.ndarray:
+        return metrics.position_scan(trigger, direction, hold)
+
+
+class NumbaBackend:
+    """Multithreaded JIT loops; requires the optional ``numba`` package."""
+
+    name = "numba"
+
+    def __init__(self) -> None:
+        from . import _numba_kernels
+
+        self._k = _numba_kernels
+
+    def rolling_delta_phi(self, prices: np.ndarray, window: int) -> np.ndarray:
+        return self._k.rolling_delta_phi(np.ascontiguousarray(prices, dtype=float), window)
+
+    def rolling_no_recovery(self, dphi: np.ndarray, window: int, p_threshold: float) -> np.ndarray:
+        return self._k.rolling_no_recovery(
+            np.ascontiguousarray(dphi, dtype=float), window, float(p_threshold)
+        )
+
+    def rolling_slope(self, prices: np.ndarray, window: int) -> np.ndarray:
+        return self._k.rolling_slope(np.ascontiguousarray(prices, dtype=float), window)
+
+    def position_scan(self, trigger: np.ndarray, direction: np.ndarray, hold: int) -> np.ndarray:
+        return self._k.position_scan(
+            np.ascontiguousarray(trigger, dtype=bool),
+            np.ascontiguousarray(direction, dtype=float),
+            int(hold),
+        )
+
+
+class ArrayModuleBackend:
+    """Whole-array kernels on a NumPy-compatible device module (e.g. CuPy).
+
+    Each kernel copies its input to the device once and the result back once.
+    The position scan is a short sequential pass and stays on the host.
+    """
+
+    def __init__(self, xp: Any, name: str) -> None:
+        self.xp = xp
+        self.name = name
+
+    def _windows(self, a: Any, window: int) -> Any:
+        return self.xp.lib.stride_tricks.sliding_window_view(a, window)
+
+    def _host(self, a: Any) -> np.ndarray:
+        return to_numpy(a)
+
+    def rolling_delta_phi(self, prices: np.ndarray, window: int) -> np.ndarray:
+        xp = self.xp
+        n = prices.size
+        out = xp.full(n, xp.nan, dtype=float)
+        if n >= window:
+            w = self._windows(xp.asarray(prices, dtype=float), window)
+            hi = w.max(axis=1)
+            out[window - 1 :] = (hi - w.min(axis=1)) / xp.maximum(xp.abs(hi), 1e-9)
+        return self._host(out)
+
+    def rolling_no_recovery(self, dphi: np.ndarray, window: int, p_threshold: float) -> np.ndarray:
+        xp = self.xp
+        n = dphi.size
+        out = xp.zeros(n, dtype=bool)
+        if n >= window:
+            d = xp.asarray(dphi, dtype=float)
+            finite = xp.isfinite(d)
+            lo = self._windows(xp.where(finite, d, xp.inf), window).min(axis=1)
+            seen = self._windows(finite, window).any(axis=1)
+            out[window - 1 :] = seen & (lo >= p_threshold)
+        return self._host(out)
+
+    def rolling_slope(self, prices: np.ndarray, window: int) -> np.ndarray:
+        xp = self.xp
+        n = prices.size
+        out = xp.full(n, xp.nan, dtype=float)
+        if n >= window:
+            x = xp.arange(window, dtype=float)
+            w = self._windows(xp.asarray(prices, dtype=float), window)
+            out[window - 1 :] = (w @ (x - x.mean()) / window) / (xp.var(x) + 1e-12)
+        return self._host(out)
+
+    def position_scan(self, trigger: np.ndarray, direction: np.ndarray, hold: int) -> np.ndarray:
+        return metrics.position_scan(trigger, direction, hold)
+
+
+def _cupy_backend() -> KernelBackend:
+    mod = xp()
+    if mod.__name__ != "cupy":
+        raise ImportError("cupy is not available")
+    return ArrayModuleBackend(mod, "cupy")
+
+
+_REGISTRY: dict[str, Callable[[], KernelBackend]] = {
+    "numpy": NumpyBackend,
+    "numba": NumbaBackend,
+    "cupy": _cupy_backend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], KernelBackend]) -> None:
+    """Add or replace a backend; ``factory`` should raise ImportError if unusable."""
+    _REGISTRY[name] = factory
+    _instance.cache_clear()
+    _auto_name.cache_clear()
+
+
+@cache
+def _instance(name: str) -> KernelBackend:
+    try:
+        factory = _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"unknown backend {name!r}; choose from {sorted(_REGISTRY)}") from None
+    return factory()
+
+
+def available_backends() -> list[str]:
+    names = []
+    for name in _REGISTRY:
+        try:
+            _instance(name)
+        except Exception:
+            continue
+        names.append(name)
+    return names
+
+
+def _bench(backend: KernelBackend, n: int = 50_000, window: int = 21, repeat: int = 3) -> float:
+    rng = np.random.default_rng(0)
+    prices = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+
+    def run() -> None:
+        dphi = backend.rolling_delta_phi(prices, window)
+        no_rec = backend.rolling_no_recovery(dphi, window, 0.045)
+        slope = backend.rolling_slope(prices, window)
+        backend.position_scan(no_rec, np.where(slope > 0, 1.0, -1.0), 5)
+
+    run()  # warm-up: JIT compilation, device init
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+@cache
+def _auto_name() -> str:
+    timings: dict[str, float] = {}
+    for name in available_backends():
+        try:
+            timings[name] = _bench(_instance(name))
+        except Exception:  # e.g. CuPy installed on a host without a usable GPU
+            continue
+    return min(timings, key=timings.__getitem__)
+
+
+def get_backend(name: str = "auto") -> KernelBackend:
+    return _instance(_auto_name() if name == "auto" else name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def delta_phi_from_window(prices: np.ndarray) -> float:
@@ -17,9 +18,43 @@ def rolling_delta_phi(prices: np.ndarray, window: int) -> np.ndarray:
     out = np.full(n, np.nan, dtype=float)
     if n < window:
         return out
-    for i in range(window - 1, n):
-        w = prices[i - window + 1 : i + 1]
-        hi = float(np.max(w))
-        lo = float(np.min(w))
-        out[i] = (hi - lo) / max(abs(hi), 1e-9)
+    w = sliding_window_view(np.asarray(prices, dtype=float), window)
+    hi = w.max(axis=1)
+    lo = w.min(axis=1)
+    out[window - 1 :] = (hi - lo) / np.maximum(np.abs(hi), 1e-9)
     return out
+
+
+def rolling_no_recovery(dphi: np.ndarray, window: int, p_threshold: float) -> np.ndarray:
+    """True where every finite ΔΦ in the trailing window stays at or above ``p_threshold``."""
+    n = dphi.size
+    out = np.zeros(n, dtype=bool)
+    if n < window:
+        return out
+    finite = np.isfinite(dphi)
+    w = sliding_window_view(np.where(finite, dphi, np.inf), window)
+    seen = sliding_window_view(finite, window).any(axis=1)
+    out[window - 1 :] = seen & (w.min(axis=1) >= p_threshold)
+    return out
+
+
+def rolling_slope(prices: np.ndarray, window: int) -> np.ndarray:
+    """Least-squares slope of price against bar offset over each trailing window."""
+    n = prices.size
+    out = np.full(n, np.nan, dtype=float)
+    if n < window:
+        return out
+    x = np.arange(window, dtype=float)
+    xc = x - x.mean()
+    w = sliding_window_view(np.asarray(prices, dtype=float), window)
+    out[window - 1 :] = (w @ xc / window) / (np.var(x) + 1e-12)
+    return out
+
+
+def position_scan(trigger: np.ndarray, direction: np.ndarray, hold: int) -> np.ndarray:
+    """Hold ``direction[i]`` for ``hold`` bars after each trigger; later triggers take over."""
+    n = trigger.size
+    idx = np.arange(n)
+    last = np.maximum.accumulate(np.where(trigger, idx, -1))
+    active = (last >= 0) & (idx - last < hold)
+    return np.where(active, np.asarray(direction, dtype=float)[np.maximum(last, 0)], 0.0)
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 import argparse
 
-import pandas as pd
-from trading.backtest import EntropyBacktester
-
 
 def main() -> None:
     ap = argparse.ArgumentParser()
@@ -12,15 +9,26 @@ def main() -> None:
     ap.add_argument("--date-col", default="date")
     ap.add_argument("--price-col", default="close")
     ap.add_argument("--capital", type=float, default=100000)
-    ap.add_argument("--no-gpu", action="store_true")
+    ap.add_argument(
+        "--backend",
+        default="numpy",
+        help="entropy kernel backend: numpy (default), numba, cupy, or auto (time all, use fastest)",
+    )
+    ap.add_argument(
+        "--no-gpu", dest="backend", action="store_const", const="numpy", help=argparse.SUPPRESS
+    )
     args = ap.parse_args()
 
+    # Heavy imports happen after argument parsing so `--help` and usage errors stay instant.
+    import pandas as pd
+    from trading.backtest import EntropyBacktester
+
     df = pd.read_csv(args.csv)
     if args.date_col in df.columns:
         df[args.date_col] = pd.to_datetime(df[args.date_col])
         df = df.set_index(args.date_col)
     df = df.rename(columns={args.price_col: "close"})[["close"]].dropna()
 
-    bt = EntropyBacktester(use_gpu=not args.no_gpu)
+    bt = EntropyBacktester(backend=args.backend)
     res = bt.backtest_entropy_strategy(df, start_capital=args.capital)
     print("Summary:", res.summary)
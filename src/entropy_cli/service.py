@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 
-import uvicorn
-from utils.settings import load_settings
+from utils.settings import get_settings
 
 
 def main() -> None:
@@ -11,7 +10,9 @@ def main() -> None:
     ap.add_argument("--host", default=None)
     ap.add_argument("--port", type=int, default=None)
     args = ap.parse_args()
-    settings = load_settings()
+    settings = get_settings()
     host = args.host or settings.service_host
     port = args.port or settings.service_port
+    import uvicorn
+
     uvicorn.run("services.api:app", host=host, port=port, reload=False)
@@ -0,0 +1,171 @@
+"""Append-only, memory-mapped tick journal.
+
+Layout: ``<root>/<YYYYMMDD>/<symbol>.ticks``, one segment per UTC day and
+symbol. A segment is a 16-byte header (magic, version, record count) followed
+by fixed-width records; files are preallocated in chunks and grown by
+doubling, so an append is a store into mapped memory plus a count bump.
+Readers map the same files and get zero-copy NumPy views of the committed
+prefix. Symbol ids are kept stable in ``<root>/symbols.json``.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from market.types import MarketTick, to_ns
+
+TICK_DTYPE = np.dtype(
+    [
+        ("ts_ns", "<i8"),
+        ("price", "<f8"),
+        ("symbol_id", "<u4"),
+        ("source", "u1"),
+        ("_pad", "V3"),
+    ]
+)
+HEADER_DTYPE = np.dtype([("magic", "S4"), ("version", "<u4"), ("count", "<u8")])
+MAGIC = b"ETJ1"
+SOURCES = ("simulated", "yahoo_finance", "alpha_vantage", "polygon_io")
+_SOURCE_IDS = {s: i for i, s in enumerate(SOURCES)}
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _day(day_index: int) -> str:
+    return datetime.fromtimestamp(day_index * 86_400, tz=UTC).strftime("%Y%m%d")
+
+
+def _map_records(path: Path, mode: Literal["r", "r+"]) -> tuple[np.memmap, np.memmap]:
+    header = np.memmap(str(path), dtype=HEADER_DTYPE, mode=mode, shape=(1,))
+    if header[0]["magic"] != MAGIC:
+        raise ValueError(f"{path} is not a tick journal segment")
+    capacity = (path.stat().st_size - HEADER_DTYPE.itemsize) // TICK_DTYPE.itemsize
+    records = np.memmap(
+        str(path), dtype=TICK_DTYPE, mode=mode, offset=HEADER_DTYPE.itemsize, shape=(capacity,)
+    )
+    return header, records
+
+
+class _Segment:
+    def __init__(self, path: Path, capacity: int) -> None:
+        self.path = path
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                f.truncate(HEADER_DTYPE.itemsize + capacity * TICK_DTYPE.itemsize)
+            header = np.memmap(str(path), dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            header[0] = (MAGIC, 1, 0)
+            header.flush()
+            del header
+        self.header, self.records = _map_records(path, "r+")
+        self.count = int(self.header[0]["count"])
+
+    def _grow(self) -> None:
+        capacity = self.records.shape[0] * 2
+        self.flush()
+        del self.header, self.records
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_DTYPE.itemsize + capacity * TICK_DTYPE.itemsize)
+        self.header, self.records = _map_records(self.path, "r+")
+
+    def append(self, ts_ns: int, price: float, symbol_id: int, source: int) -> None:
+        if self.count == self.records.shape[0]:
+            self._grow()
+        self.records[self.count] = (ts_ns, price, symbol_id, source, b"")
+        self.count += 1
+        # Publish after the record is written so readers only ever see whole records.
+        self.header[0]["count"] = self.count
+
+    def flush(self) -> None:
+        self.records.flush()
+        self.header.flush()
+
+
+class TickJournal:
+    def __init__(self, root: str | Path, segment_capacity: int = 1 << 16) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_capacity = segment_capacity
+        self._symbols_path = self.root / "symbols.json"
+        self.symbol_ids: dict[str, int] = (
+            json.loads(self._symbols_path.read_text()) if self._symbols_path.exists() else {}
+        )
+        self._open: dict[str, tuple[int, int, _Segment]] = {}
+
+    def _symbol_id(self, symbol: str) -> int:
+        sid = self.symbol_ids.get(symbol)
+        if sid is None:
+            sid = self.symbol_ids[symbol] = len(self.symbol_ids)
+            tmp = self._symbols_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.symbol_ids))
+            tmp.replace(self._symbols_path)
+        return sid
+
+    def _segment_path(self, day: str, symbol: str) -> Path:
+        return self.root / day / f"{symbol}.ticks"
+
+    def write(self, symbol: str, ts_ns: int, price: float, source: str = "simulated") -> None:
+        day = ts_ns // _NS_PER_DAY
+        current = self._open.get(symbol)
+        if current is None or current[0] != day:
+            if current is not None:
+                current[2].flush()
+            seg = _Segment(self._segment_path(_day(day), symbol), self.segment_capacity)
+            current = self._open[symbol] = (day, self._symbol_id(symbol), seg)
+        current[2].append(ts_ns, price, current[1], _SOURCE_IDS[source])
+
+    def append(self, tick: MarketTick) -> None:
+        self.write(tick.symbol, to_ns(tick.ts), tick.price, tick.source)
+
+    def days(self, symbol: str) -> list[str]:
+        return sorted(p.parent.name for p in self.root.glob(f"*/{symbol}.ticks"))
+
+    def read(self, symbol: str, day: str | None = None) -> np.ndarray:
+        """Zero-copy view of one day's committed records (latest day by default)."""
+        if day is None:
+            days = self.days(symbol)
+            if not days:
+                return np.empty(0, dtype=TICK_DTYPE)
+            day = days[-1]
+        path = self._segment_path(day, symbol)
+        if not path.exists():
+            return np.empty(0, dtype=TICK_DTYPE)
+        header, records = _map_records(path, "r")
+        return records[: int(header[0]["count"])]
+
+    def tail(self, symbol: str, n: int, since_ns: int | None = None) -> np.ndarray:
+        """The last ``n`` records across day segments, oldest first.
+
+        ``since_ns`` drops records stamped before it, e.g. ticks from an earlier session.
+        """
+        if n <= 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        first_day = None if since_ns is None else _day(since_ns // _NS_PER_DAY)
+        parts: list[np.ndarray] = []
+        need = n
+        for day in reversed(self.days(symbol)):
+            if first_day is not None and day < first_day:
+                break
+            recs = self.read(symbol, day)
+            if since_ns is not None:
+                # Segments are appended in time order, so the cutoff is a prefix.
+                recs = recs[np.searchsorted(recs["ts_ns"], since_ns) :]
+            parts.append(recs[-need:] if need < recs.size else recs)
+            need -= parts[-1].size
+            if need <= 0:
+                break
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts[::-1]) if parts else np.empty(0, dtype=TICK_DTYPE)
+
+    def flush(self) -> None:
+        for _, _, seg in self._open.values():
+            seg.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._open.clear()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Literal
 
 
@@ -11,3 +11,12 @@ class MarketTick:
     ts: datetime
     price: float
     source: Literal["simulated", "yahoo_finance", "alpha_vantage", "polygon_io"]
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_ns(ts: datetime) -> int:
+    """Exact integer nanoseconds since the Unix epoch for an aware datetime."""
+    delta = ts - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 10**9 + delta.microseconds * 1_000
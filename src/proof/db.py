@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Callable, Sequence
 from typing import Any
 
+import numpy as np
 from sqlalchemy import (
     JSON,
     BigInteger,
@@ -11,17 +14,90 @@ from sqlalchemy import (
     MetaData,
     String,
     Table,
+    and_,
     create_engine,
+    delete,
+    func,
     insert,
     select,
+    update,
 )
+from sqlalchemy.dialects import postgresql, sqlite
 
 from proof.capsule import CapsuleModel
 
+HISTOGRAM_METRICS = ("delta_phi", "confidence")
+HISTOGRAM_BINS = 200
+HISTOGRAM_RANGE = (0.0, 1.0)  # values outside are counted in the first/last bin
+_FLAGS = ("np_wall", "no_recovery", "sat", "undecided")
+# Coarser rollup tiers kept alongside the base buckets, by table-name suffix.
+ROLLUP_TIERS = {"hour": 3600 * 10**9, "day": 86_400 * 10**9}
+_UPSERTS: dict[str, Callable[[Table], Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def histogram_edges() -> np.ndarray:
+    return np.linspace(*HISTOGRAM_RANGE, HISTOGRAM_BINS + 1)
+
+
+def _bin(value: float) -> int | None:
+    if not math.isfinite(value):
+        return None
+    lo, hi = HISTOGRAM_RANGE
+    return min(max(int((value - lo) / (hi - lo) * HISTOGRAM_BINS), 0), HISTOGRAM_BINS - 1)
+
+
+def _quantiles(counts: np.ndarray, qs: np.ndarray) -> list[float]:
+    """Quantiles of binned data, interpolating linearly inside a bin."""
+    cum = np.cumsum(counts)
+    target = qs * cum[-1]
+    # A zero target must land on the first non-empty bin, not on leading empty ones.
+    i = np.where(
+        target > 0, np.searchsorted(cum, target, side="left"), np.searchsorted(cum, 0, "right")
+    )
+    i = np.minimum(i, counts.size - 1)
+    before = cum[i] - counts[i]
+    frac = np.divide(target - before, counts[i], out=np.zeros_like(target), where=counts[i] > 0)
+    edges = histogram_edges()
+    return (edges[i] + frac * (edges[i + 1] - edges[i])).tolist()
+
+
+def _capsule_deltas(payload: dict[str, Any]) -> tuple[dict[str, int], list[tuple[str, int]]]:
+    """Rollup counter increments and (metric, bin) histogram hits of one capsule."""
+    sig = payload["signal"]
+    sat = payload["sat_provenance"].get("verdict") == "SAT"
+    flags = {
+        "count": 1,
+        "np_wall": int(sig["np_wall"]),
+        "no_recovery": int(sig["no_recovery"]),
+        "sat": int(sat),
+        "undecided": int(not sat),
+    }
+    bins = []
+    for metric in HISTOGRAM_METRICS:
+        b = _bin(float(sig[metric]))
+        if b is not None:
+            bins.append((metric, b))
+    return flags, bins
+
 
 class ProofCapsuleDB:
-    def __init__(self, url: str = "sqlite:///./entropy_capsules.db"):
+    """Capsule store plus rollups kept up to date on every insert.
+
+    ``capsule_rollups`` holds per (symbol, time bucket) counters of np_wall,
+    no_recovery and SAT/UNDECIDED verdicts; ``capsule_histograms`` holds binned
+    ΔΦ and confidence counts for the same buckets. Both are also kept per hour
+    and per day (``capsule_rollups_hour``, ``capsule_histograms_day``, ...), bumped
+    in the insert's transaction. Analytics queries only read these small tables,
+    from the coarsest tier that divides the interval and the start/end bounds,
+    grouping buckets into any multiple of ``bucket_ns``.
+    """
+
+    def __init__(self, url: str = "sqlite:///./entropy_capsules.db", bucket_ns: int = 60 * 10**9):
         self.engine = create_engine(url, future=True)
+        self.bucket_ns = bucket_ns
         self.meta = MetaData()
         self.capsules = Table(
             "capsules",
@@ -35,7 +111,88 @@ class ProofCapsuleDB:
         )
         Index("ix_capsules_symbol_ts", self.capsules.c.symbol, self.capsules.c.timestamp_ns)
         Index("ux_capsules_signal_hash", self.capsules.c.signal_hash)
+        sizes = {"": bucket_ns} | {
+            f"_{name}": size
+            for name, size in ROLLUP_TIERS.items()
+            if size > bucket_ns and size % bucket_ns == 0
+        }
+        # (bucket size, rollup table, histogram table), finest first.
+        self.tiers = [(size, *self._rollup_tables(suffix)) for suffix, size in sizes.items()]
+        _, self.rollups, self.histograms = self.tiers[0]
+        self._upserts: dict[str, Any] = {}
         self.meta.create_all(self.engine)
+        with self.engine.begin() as conn:
+            # create_all skips indexes of tables that already exist.
+            for table in self.meta.sorted_tables:
+                for ix in table.indexes:
+                    ix.create(conn, checkfirst=True)
+        with self.engine.connect() as conn:
+            stored = conn.execute(select(self.capsules.c.id).limit(1)).first() is not None
+            backfill = stored and any(
+                conn.execute(select(r.c.symbol).limit(1)).first() is None for _, r, _ in self.tiers
+            )
+        if backfill:
+            self.rebuild_rollups()
+
+    def _rollup_tables(self, suffix: str) -> tuple[Table, Table]:
+        rollups = Table(
+            f"capsule_rollups{suffix}",
+            self.meta,
+            Column("symbol", String, primary_key=True),
+            Column("bucket_ns", BigInteger, primary_key=True),
+            Column("count", Integer, nullable=False),
+            *(Column(flag, Integer, nullable=False) for flag in _FLAGS),
+        )
+        histograms = Table(
+            f"capsule_histograms{suffix}",
+            self.meta,
+            Column("symbol", String, primary_key=True),
+            Column("bucket_ns", BigInteger, primary_key=True),
+            Column("metric", String, primary_key=True),
+            Column("bin", Integer, primary_key=True),
+            Column("count", Integer, nullable=False),
+        )
+        Index(
+            f"ix_capsule_histograms{suffix}_metric_bucket",
+            histograms.c.metric,
+            histograms.c.bucket_ns,
+        )
+        return rollups, histograms
+
+    def _tier(self, *spans: int | None) -> tuple[Table, Table]:
+        """Rollup and histogram tables of the coarsest tier whose bucket divides every span."""
+        for size, rollups, histograms in reversed(self.tiers):
+            if all(s is None or s % size == 0 for s in spans):
+                return rollups, histograms
+        return self.rollups, self.histograms
+
+    def _upsert(self, conn, table: Table) -> Any:
+        """Cached ``INSERT .. ON CONFLICT DO UPDATE`` adding to ``table``'s counters."""
+        stmt = self._upserts.get(table.name)
+        if stmt is None:
+            counters = [c.name for c in table.columns if not c.primary_key]
+            ins = _UPSERTS[conn.dialect.name](table)
+            stmt = self._upserts[table.name] = ins.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns),
+                set_={c: table.c[c] + ins.excluded[c] for c in counters},
+            )
+        return stmt
+
+    def _bump(self, conn, table: Table, rows: list[dict[str, Any]]) -> None:
+        """Add each row's counters to the row with the same key, inserting it if missing."""
+        if conn.dialect.name in _UPSERTS:
+            conn.execute(self._upsert(conn, table), rows)
+            return
+        # Other dialects: not atomic against concurrent writers of the same bucket.
+        keys = [c.name for c in table.primary_key.columns]
+        counters = [c.name for c in table.columns if not c.primary_key]
+        for row in rows:
+            where = and_(*(table.c[k] == row[k] for k in keys))
+            changed = conn.execute(
+                update(table).where(where).values({c: table.c[c] + row[c] for c in counters})
+            )
+            if changed.rowcount == 0:
+                conn.execute(insert(table).values(**row))
 
     def store_capsule(self, symbol: str, capsule: CapsuleModel) -> None:
         payload: dict[str, Any] = {
@@ -54,6 +211,61 @@ class ProofCapsuleDB:
                     payload=payload,
                 )
             )
+            ts = int(capsule.timestamp_ns)
+            flags, bins = _capsule_deltas(payload)
+            for size, rollups, histograms in self.tiers:
+                bucket = ts - ts % size
+                self._bump(conn, rollups, [{"symbol": symbol, "bucket_ns": bucket, **flags}])
+                if bins:
+                    rows = [
+                        {"symbol": symbol, "bucket_ns": bucket, "metric": m, "bin": b, "count": 1}
+                        for m, b in bins
+                    ]
+                    self._bump(conn, histograms, rows)
+
+    def rebuild_rollups(self) -> None:
+        """Recompute the rollup tables from the raw capsules (e.g. for a pre-rollup database)."""
+        # Keyed by (symbol, base bucket); coarser tiers are summed from these below.
+        rollups: dict[tuple[str, int], dict[str, int]] = {}
+        hist: dict[tuple[str, int, str, int], int] = {}
+        stmt = select(self.capsules.c.symbol, self.capsules.c.timestamp_ns, self.capsules.c.payload)
+        with self.engine.begin() as conn:
+            for r in conn.execute(stmt):
+                bucket = r.timestamp_ns - r.timestamp_ns % self.bucket_ns
+                flags, bins = _capsule_deltas(r.payload)
+                acc = rollups.setdefault((r.symbol, bucket), dict.fromkeys(flags, 0))
+                for name, v in flags.items():
+                    acc[name] += v
+                for metric, b in bins:
+                    k = (r.symbol, bucket, metric, b)
+                    hist[k] = hist.get(k, 0) + 1
+            for size, rollup_table, hist_table in self.tiers:
+                tier_rollups: dict[tuple[str, int], dict[str, int]] = {}
+                for (sym, bucket), counts in rollups.items():
+                    acc = tier_rollups.setdefault(
+                        (sym, bucket - bucket % size), dict.fromkeys(counts, 0)
+                    )
+                    for name, v in counts.items():
+                        acc[name] += v
+                tier_hist: dict[tuple[str, int, str, int], int] = {}
+                for (sym, bucket, metric, b), c in hist.items():
+                    k = (sym, bucket - bucket % size, metric, b)
+                    tier_hist[k] = tier_hist.get(k, 0) + c
+                conn.execute(delete(rollup_table))
+                conn.execute(delete(hist_table))
+                if tier_rollups:
+                    conn.execute(
+                        insert(rollup_table),
+                        [{"symbol": s, "bucket_ns": b} | v for (s, b), v in tier_rollups.items()],
+                    )
+                if tier_hist:
+                    conn.execute(
+                        insert(hist_table),
+                        [
+                            {"symbol": s, "bucket_ns": b, "metric": m, "bin": i, "count": c}
+                            for (s, b, m, i), c in tier_hist.items()
+                        ],
+                    )
 
     def query_historical_proofs(
         self, symbol: str, entropy_range: tuple[float, float]
@@ -67,3 +279,129 @@ class ProofCapsuleDB:
                 if isinstance(dphi, (int | float)) and lo <= dphi <= hi:
                     rows.append(dict(r._mapping))
         return rows
+
+    def _filters(self, table: Table, symbol: str | None, start_ns: int | None, end_ns: int | None):
+        conds = []
+        if symbol is not None:
+            conds.append(table.c.symbol == symbol)
+        if start_ns is not None:
+            conds.append(table.c.bucket_ns >= start_ns)
+        if end_ns is not None:
+            conds.append(table.c.bucket_ns < end_ns)
+        return conds
+
+    def _interval(self, table: Table, interval_ns: int):
+        if interval_ns <= 0 or interval_ns % self.bucket_ns:
+            raise ValueError(f"interval must be a positive multiple of {self.bucket_ns} ns")
+        return (table.c.bucket_ns - table.c.bucket_ns % interval_ns).label("bucket_ns")
+
+    def histogram(
+        self,
+        metric: str,
+        *,
+        symbol: str | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> dict[str, Any]:
+        """Binned counts of ``metric`` (``delta_phi`` or ``confidence``)."""
+        if metric not in HISTOGRAM_METRICS:
+            raise ValueError(f"unknown histogram metric {metric!r}")
+        _, h = self._tier(start_ns, end_ns)
+        stmt = (
+            select(h.c.bin, func.sum(h.c.count))
+            .where(h.c.metric == metric, *self._filters(h, symbol, start_ns, end_ns))
+            .group_by(h.c.bin)
+        )
+        counts = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        with self.engine.connect() as conn:
+            for b, c in conn.execute(stmt):
+                counts[b] = c
+        return {"metric": metric, "edges": histogram_edges().tolist(), "counts": counts.tolist()}
+
+    def interval_counts(
+        self,
+        interval_ns: int,
+        *,
+        symbol: str | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Capsule, np_wall, no_recovery, SAT and UNDECIDED counts per symbol and interval."""
+        r, _ = self._tier(interval_ns, start_ns, end_ns)
+        bucket = self._interval(r, interval_ns)
+        stmt = (
+            select(
+                r.c.symbol,
+                bucket,
+                *(func.sum(r.c[c]).label(c) for c in ("count", *_FLAGS)),
+            )
+            .where(*self._filters(r, symbol, start_ns, end_ns))
+            .group_by(r.c.symbol, bucket)
+            .order_by(r.c.symbol, bucket)
+        )
+        with self.engine.connect() as conn:
+            return [dict(row._mapping) for row in conn.execute(stmt)]
+
+    def verdict_ratios(
+        self,
+        *,
+        symbol: str | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> dict[str, dict[str, float]]:
+        """SAT / UNDECIDED counts and SAT share per symbol."""
+        r, _ = self._tier(start_ns, end_ns)
+        stmt = (
+            select(r.c.symbol, func.sum(r.c.sat), func.sum(r.c.undecided))
+            .where(*self._filters(r, symbol, start_ns, end_ns))
+            .group_by(r.c.symbol)
+        )
+        with self.engine.connect() as conn:
+            return {
+                sym: {"sat": sat, "undecided": und, "sat_ratio": sat / (sat + und)}
+                for sym, sat, und in conn.execute(stmt)
+            }
+
+    def percentiles(
+        self,
+        metric: str,
+        qs: Sequence[float],
+        interval_ns: int,
+        *,
+        symbol: str | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Per symbol and interval percentiles of ``metric``, read off the histogram rollups.
+
+        Accurate to one bin width (``1 / HISTOGRAM_BINS``).
+        """
+        if metric not in HISTOGRAM_METRICS:
+            raise ValueError(f"unknown histogram metric {metric!r}")
+        q = np.asarray(qs, dtype=float)
+        if q.size == 0 or np.any((q < 0) | (q > 1)):
+            raise ValueError("percentiles must lie in [0, 1]")
+        _, h = self._tier(interval_ns, start_ns, end_ns)
+        bucket = self._interval(h, interval_ns)
+        stmt = (
+            select(h.c.symbol, bucket, h.c.bin, func.sum(h.c.count))
+            .where(h.c.metric == metric, *self._filters(h, symbol, start_ns, end_ns))
+            .group_by(h.c.symbol, bucket, h.c.bin)
+            .order_by(h.c.symbol, bucket)
+        )
+        groups: dict[tuple[str, int], np.ndarray] = {}
+        with self.engine.connect() as conn:
+            for sym, b, bin_, c in conn.execute(stmt):
+                counts = groups.get((sym, b))
+                if counts is None:
+                    counts = groups[(sym, b)] = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+                counts[bin_] = c
+        return [
+            {
+                "symbol": sym,
+                "bucket_ns": b,
+                "count": int(counts.sum()),
+                "values": dict(zip(q.tolist(), _quantiles(counts, q), strict=True)),
+            }
+            for (sym, b), counts in groups.items()
+        ]
@@ -1,19 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Literal
 
-from entropy.analyzer import EntropyAnalyzer
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from market.pipeline import MarketDataPipeline
 from pydantic import BaseModel
-from trading.live import EntropyTrader
-from utils.settings import load_settings
+from utils.settings import settings_store
 
 from services.metrics import engine_up, metrics_response
+from services.wire import WireFormat
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Trader, DB schema and pipeline are built here rather than at import time so
+    # importing the app (workers, tests, tooling) stays cheap and side-effect free.
+    from market.pipeline import MarketDataPipeline
+    from trading.live import EntropyTrader
+
+    store = settings_store()
+    settings = store.current
+    app.state.trader = EntropyTrader(
+        db_url=settings.database_url, symbols=settings.symbols, store=store
+    )
+    app.state.pipeline = MarketDataPipeline(
+        symbols=[settings.symbols[0] if settings.symbols else "SPY"]
+    )
+    app.state.live_task = None
+    # Hot reload: the watcher polls the YAML; running analyzers pick up new versions.
+    watcher = asyncio.create_task(store.watch())
+    engine_up.set(1)
+    try:
+        yield
+    finally:
+        watcher.cancel()
+        task: asyncio.Task | None = app.state.live_task
+        if task and not task.done():
+            task.cancel()
+        engine_up.set(0)
+
 
-settings = load_settings()
-app = FastAPI(title="Entropy Trading Engine")
+app = FastAPI(title="Entropy Trading Engine", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -22,33 +52,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-trader = EntropyTrader(db_url=settings.database_url, symbols=settings.symbols)
-db = trader.db
-analyzer = EntropyAnalyzer(
-    window=settings.entropy_window,
-    p_threshold=settings.p_threshold,
-    np_threshold=settings.np_threshold,
-)
-pipeline = MarketDataPipeline(symbols=[settings.symbols[0] if settings.symbols else "SPY"])
-_live_task: asyncio.Task | None = None
-
 
 class QueryRange(BaseModel):
     symbol: str
     entropy_range: tuple[float, float]
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    engine_up.set(1)
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    global _live_task
-    if _live_task and not _live_task.done():
-        _live_task.cancel()
-    engine_up.set(0)
+Metric = Literal["delta_phi", "confidence"]
+_NS = 10**9
 
 
 @app.get("/health")
@@ -57,15 +68,109 @@ def health() -> dict[str, bool]:
 
 
 @app.post("/proofs/query")
-def proofs_query(body: QueryRange):
-    return db.query_historical_proofs(body.symbol, body.entropy_range)
+def proofs_query(body: QueryRange, request: Request):
+    return request.app.state.trader.db.query_historical_proofs(body.symbol, body.entropy_range)
+
+
+@app.get("/analytics/histogram/{metric}")
+def analytics_histogram(
+    metric: Metric,
+    request: Request,
+    symbol: str | None = None,
+    start_ns: int | None = None,
+    end_ns: int | None = None,
+):
+    db = request.app.state.trader.db
+    return db.histogram(metric, symbol=symbol, start_ns=start_ns, end_ns=end_ns)
+
+
+@app.get("/analytics/counts")
+def analytics_counts(
+    request: Request,
+    interval_s: int = 3600,
+    symbol: str | None = None,
+    start_ns: int | None = None,
+    end_ns: int | None = None,
+):
+    db = request.app.state.trader.db
+    try:
+        return db.interval_counts(interval_s * _NS, symbol=symbol, start_ns=start_ns, end_ns=end_ns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@app.get("/analytics/verdicts")
+def analytics_verdicts(
+    request: Request,
+    symbol: str | None = None,
+    start_ns: int | None = None,
+    end_ns: int | None = None,
+):
+    return request.app.state.trader.db.verdict_ratios(
+        symbol=symbol, start_ns=start_ns, end_ns=end_ns
+    )
+
+
+@app.get("/analytics/percentiles/{metric}")
+def analytics_percentiles(
+    metric: Metric,
+    request: Request,
+    q: Annotated[list[float], Query()] = [0.5, 0.9, 0.99],  # noqa: B006
+    interval_s: int = 3600,
+    symbol: str | None = None,
+    start_ns: int | None = None,
+    end_ns: int | None = None,
+):
+    db = request.app.state.trader.db
+    try:
+        return db.percentiles(
+            metric, q, interval_s * _NS, symbol=symbol, start_ns=start_ns, end_ns=end_ns
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+async def _serve_prices(ws: WebSocket, symbols: list[str], fmt: WireFormat, flush_ms: int) -> None:
+    from contextlib import aclosing
+
+    from services.wire import TickEncoder, tick_frames
+
+    await ws.accept()
+    encoder = TickEncoder(symbols, fmt)
+    if fmt == "binary":
+        await ws.send_text(encoder.hello())
+    frames = tick_frames(ws.app.state.pipeline, encoder, flush_ms / 1000)
+    async with aclosing(frames):
+        async for frame in frames:
+            if isinstance(frame, bytes):
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_text(frame)
+
+
+@app.websocket("/ws/prices")
+async def ws_prices_multi(
+    ws: WebSocket,
+    symbols: str = "SPY",
+    fmt: Annotated[WireFormat, Query(alias="format")] = "json",
+    flush_ms: Annotated[int, Query(ge=0)] = 0,
+) -> None:
+    """Several comma-separated ``symbols`` on one socket."""
+    names = list(dict.fromkeys(s for s in symbols.split(",") if s))
+    if not names:
+        await ws.close(code=1008)
+        return
+    await _serve_prices(ws, names, fmt, flush_ms)
 
 
 @app.websocket("/ws/prices/{symbol}")
-async def ws_prices(ws: WebSocket, symbol: str) -> None:
-    await ws.accept()
-    async for tick in pipeline.stream_prices(symbol):
-        await ws.send_json({"symbol": tick.symbol, "ts": tick.ts.isoformat(), "price": tick.price})
+async def ws_prices(
+    ws: WebSocket,
+    symbol: str,
+    fmt: Annotated[WireFormat, Query(alias="format")] = "json",
+    flush_ms: Annotated[int, Query(ge=0)] = 0,
+) -> None:
+    await _serve_prices(ws, [symbol], fmt, flush_ms)
 
 
 @app.get("/metrics")
@@ -74,9 +179,9 @@ def metrics():
 
 
 @app.get("/run/live")
-async def run_live():
-    global _live_task
-    if _live_task and not _live_task.done():
+async def run_live(request: Request):
+    state = request.app.state
+    if state.live_task and not state.live_task.done():
         return {"status": "already_running"}
-    _live_task = asyncio.create_task(trader.run_live_trading())
+    state.live_task = asyncio.create_task(state.trader.run_live_trading())
     return {"status": "started"}
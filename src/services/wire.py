@@ -0,0 +1,172 @@
+"""Wire formats and batching for the price WebSockets.
+
+``json`` keeps the original message shape, ``{"symbol", "ts" (ISO-8601), "price"}``;
+batched frames carry a JSON array of those objects. ``binary`` frames are a
+run of packed little-endian records, ``<Hqd``: symbol index (position in the
+subscription list, announced in a text ``subscribed`` message first), ns
+timestamp, price. Clients can read a frame with :func:`decode_binary`.
+
+With a zero flush interval every tick goes out in its own frame; otherwise all
+ticks that arrive within the interval share one frame. A socket that falls more
+than ``max_pending`` ticks behind is sent only the latest tick of each symbol
+until it catches up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Literal, Protocol
+
+from market.types import MarketTick, to_ns
+
+if TYPE_CHECKING:
+    import numpy as np
+
+WireFormat = Literal["json", "binary"]
+# Packed (unaligned) field layout of one binary record; matches _RECORD.
+WIRE_FIELDS = [("symbol", "<u2"), ("ts_ns", "<i8"), ("price", "<f8")]
+_RECORD = struct.Struct("<Hqd")
+MAX_PENDING = 4096  # merged ticks buffered per socket before coalescing by symbol
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+class PriceSource(Protocol):
+    """Anything with ``MarketDataPipeline.stream_prices``."""
+
+    def stream_prices(self, symbol: str) -> AsyncIterator[MarketTick]: ...
+
+
+class TickEncoder:
+    def __init__(self, symbols: Sequence[str], fmt: WireFormat = "json") -> None:
+        self.symbols = list(symbols)
+        self.fmt = fmt
+        self._ids = {s: i for i, s in enumerate(self.symbols)}
+
+    def hello(self) -> str:
+        return _dumps(
+            {
+                "type": "subscribed",
+                "format": self.fmt,
+                "symbols": self.symbols,
+                "record": _RECORD.format,
+            }
+        )
+
+    def encode_one(self, tick: MarketTick) -> str | bytes:
+        if self.fmt == "binary":
+            return _RECORD.pack(self._ids[tick.symbol], to_ns(tick.ts), tick.price)
+        return _dumps({"symbol": tick.symbol, "ts": tick.ts.isoformat(), "price": tick.price})
+
+    def encode(self, ticks: Sequence[MarketTick]) -> str | bytes:
+        if self.fmt == "binary":
+            buf = bytearray(_RECORD.size * len(ticks))
+            ids = self._ids
+            for i, t in enumerate(ticks):
+                _RECORD.pack_into(buf, i * _RECORD.size, ids[t.symbol], to_ns(t.ts), t.price)
+            return bytes(buf)
+        return _dumps(
+            [{"symbol": t.symbol, "ts": t.ts.isoformat(), "price": t.price} for t in ticks]
+        )
+
+
+def decode_binary(frame: bytes) -> np.ndarray:
+    import numpy as np
+
+    return np.frombuffer(frame, dtype=np.dtype(WIRE_FIELDS))
+
+
+class _TickMerge:
+    """Ticks from several pump tasks, bounded at ``maxsize``.
+
+    Once full, or while a symbol already has a coalesced tick, a new tick only
+    replaces that symbol's pending latest tick, so per-symbol order is kept.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.queue: deque[MarketTick] = deque()
+        self.latest: dict[str, MarketTick] = {}
+        self.coalesced = 0
+        self._ready = asyncio.Event()
+
+    def put(self, tick: MarketTick) -> None:
+        if tick.symbol in self.latest:
+            self.coalesced += 1
+            self.latest[tick.symbol] = tick
+        elif len(self.queue) >= self.maxsize:
+            self.latest[tick.symbol] = tick
+        else:
+            self.queue.append(tick)
+        self.wake()
+
+    def wake(self) -> None:
+        self._ready.set()
+
+    def take(self) -> list[MarketTick]:
+        """Everything pending: queued ticks first, then the coalesced ones."""
+        out = list(self.queue)
+        self.queue.clear()
+        if self.latest:
+            out.extend(self.latest.values())
+            self.latest.clear()
+        self._ready.clear()
+        return out
+
+    async def get(self, pumps: set[asyncio.Task[None]]) -> list[MarketTick]:
+        """Wait for ticks or for a pump to finish; re-raises pump errors.
+
+        Returns an empty list once every pump has ended and nothing is pending.
+        """
+        while not (self.queue or self.latest):
+            for task in [t for t in pumps if t.done()]:
+                pumps.discard(task)
+                task.result()
+            if not pumps:
+                return []
+            await self._ready.wait()
+            self._ready.clear()
+        return self.take()
+
+
+async def tick_frames(
+    pipeline: PriceSource,
+    encoder: TickEncoder,
+    flush_interval: float = 0.0,
+    max_pending: int = MAX_PENDING,
+) -> AsyncGenerator[str | bytes, None]:
+    """Encoded frames for ``encoder.symbols``, merged into one stream.
+
+    Ends when every symbol's price stream ends; a failing stream's exception
+    propagates to the caller.
+    """
+    symbols = encoder.symbols
+    if len(symbols) == 1 and flush_interval <= 0:
+        async for tick in pipeline.stream_prices(symbols[0]):
+            yield encoder.encode_one(tick)
+        return
+
+    merged = _TickMerge(max_pending)
+
+    async def pump(symbol: str) -> None:
+        async for tick in pipeline.stream_prices(symbol):
+            merged.put(tick)
+
+    tasks = [asyncio.create_task(pump(s)) for s in symbols]
+    for t in tasks:
+        t.add_done_callback(lambda _: merged.wake())
+    pumps = set(tasks)
+    try:
+        while ticks := await merged.get(pumps):
+            if flush_interval <= 0:
+                for tick in ticks:
+                    yield encoder.encode_one(tick)
+                continue
+            await asyncio.sleep(flush_interval)
+            yield encoder.encode(ticks + merged.take())
+    finally:
+        for t in tasks:
+            t.cancel()
@@ -5,7 +5,8 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 from entropy.analyzer import EntropyAnalyzer, EntropySignal
-from utils.arrays import to_numpy, xp
+from entropy.backends import KernelBackend, get_backend
+from utils.arrays import xp
 
 
 @dataclass
@@ -13,6 +14,31 @@ class BacktestResults:
     summary: dict[str, float]
     equity_curve: pd.Series
     signals: list[EntropySignal]
+    # Aligned so that positions * market_returns is the per-bar strategy return.
+    positions: np.ndarray
+    market_returns: np.ndarray
+
+
+CONFIDENCE = 0.85  # minimum signal confidence to enter
+HOLD = 5  # bars a position is held after a trigger
+
+
+def entropy_positions(
+    backend: KernelBackend,
+    dphi: np.ndarray,
+    no_recovery: np.ndarray,
+    direction: np.ndarray,
+    p_thresh: float,
+    np_thresh: float,
+    confidence: float = CONFIDENCE,
+    hold: int = HOLD,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Entry triggers and held positions (+1/-1/0) per bar from precomputed ΔΦ features."""
+    span = max(np_thresh - p_thresh, 1e-9)
+    conf = np.clip((dphi - p_thresh) / span, 0, 1)
+    conf[~np.isfinite(conf)] = 0.0
+    trigger = (conf >= confidence) & ((dphi > np_thresh) | no_recovery)
+    return trigger, backend.position_scan(trigger, direction, hold)
 
 
 def _performance(equity: pd.Series) -> dict[str, float]:
@@ -31,53 +57,40 @@ class EntropyBacktester:
         window: int = 21,
         p_thresh: float = 0.045,
         np_thresh: float = 0.09,
+        backend: str | None = None,
     ):
-        self.xp = xp() if use_gpu else np
+        if backend is None:
+            # `use_gpu` predates the backend registry: CuPy when it resolves, else NumPy.
+            backend = "cupy" if use_gpu and xp().__name__ == "cupy" else "numpy"
+        self.backend = get_backend(backend)
         self.analyzer = EntropyAnalyzer(window=window, p_threshold=p_thresh, np_threshold=np_thresh)
 
     def backtest_entropy_strategy(
         self, historical_data: pd.DataFrame, start_capital: float = 100000
     ) -> BacktestResults:
         close = historical_data["close"].astype(float).to_numpy()
-        n = close.size
         window = self.analyzer.window
-        arr = self.xp.asarray(close)
-        dphi = self.xp.full(n, self.xp.nan)
-        for i in range(window - 1, n):
-            w = arr[i - window + 1 : i + 1]
-            hi = float(self.xp.max(w))
-            lo = float(self.xp.min(w))
-            dphi[i] = (hi - lo) / max(abs(hi), 1e-9)
-        dphi_np = to_numpy(dphi)
-        np_wall = dphi_np > self.analyzer.np_thresh
-        no_rec = np.zeros(n, dtype=bool)
-        for i in range(window - 1, n):
-            trail = dphi_np[i - window + 1 : i + 1]
-            finite = trail[np.isfinite(trail)]
-            no_rec[i] = finite.size > 0 and np.min(finite) >= self.analyzer.p_thresh
-        span = max(self.analyzer.np_thresh - self.analyzer.p_thresh, 1e-9)
-        conf = np.clip((dphi_np - self.analyzer.p_thresh) / span, 0, 1)
-        conf[~np.isfinite(conf)] = 0.0
-        pos = np.zeros(n)
-        hold = 5
-        for i in range(window - 1, n):
-            if conf[i] >= 0.85 and (np_wall[i] or no_rec[i]):
-                x = np.arange(window, dtype=float)
-                y = close[i - window + 1 : i + 1]
-                slope = np.cov(x, y, bias=True)[0, 1] / (np.var(x) + 1e-12)
-                direction = 1.0 if slope > 0 else -1.0
-                pos[i : min(i + hold, n)] = direction
+        dphi = self.backend.rolling_delta_phi(close, window)
+        no_rec = self.backend.rolling_no_recovery(dphi, window, self.analyzer.p_thresh)
+        direction = np.where(self.backend.rolling_slope(close, window) > 0, 1.0, -1.0)
+        trigger, pos = entropy_positions(
+            self.backend, dphi, no_rec, direction, self.analyzer.p_thresh, self.analyzer.np_thresh
+        )
         ret = pd.Series(close, index=historical_data.index).pct_change().fillna(0.0).to_numpy()
         strat = pos[:-1] * ret[1:]
         equity = np.empty(ret.size, dtype=float)
         equity[0] = start_capital
         equity[1:] = start_capital * np.cumprod(1.0 + strat)
         equity_series = pd.Series(equity, index=historical_data.index)
-        signals: list[EntropySignal] = []
-        for i in range(window - 1, n):
-            if conf[i] >= 0.85 and (np_wall[i] or no_rec[i]):
-                sig = self.analyzer.analyze_entropy_drift(close[: i + 1])
-                signals.append(sig)
+        # The analyzer only needs 2*window-1 bars to reproduce the last window of ΔΦ.
+        signals = [
+            self.analyzer.analyze_entropy_drift(close[max(0, i - 2 * window + 2) : i + 1])
+            for i in np.flatnonzero(trigger)
+        ]
         return BacktestResults(
-            summary=_performance(equity_series), equity_curve=equity_series, signals=signals
+            summary=_performance(equity_series),
+            equity_curve=equity_series,
+            signals=signals,
+            positions=pos[:-1],
+            market_returns=ret[1:],
         )
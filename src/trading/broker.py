@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
+from trading.fills import BUY, SELL, BatchBroker, FillModel, TradeLog
+
 FEE_PER_TRADE = 0.0005  # 5 bps demo fee
 
 
@@ -14,21 +18,62 @@ class Order:
 
 
 class MockBroker:
-    def __init__(self) -> None:
-        self.positions: dict[str, float] = {}
-        self.cash = 100_000.0
-        self.trades: list[Order] = []
+    """Order-at-a-time facade over :class:`~trading.fills.BatchBroker`.
+
+    Fees are charged on the filled notional; sells are capped at the current
+    long position. ``trades`` holds only the most recent ``trade_capacity`` fills.
+    """
+
+    def __init__(
+        self,
+        model: FillModel | None = None,
+        trade_capacity: int = 10_000,
+        trade_log_path: str | None = None,
+    ) -> None:
+        self.engine = BatchBroker(
+            cash=100_000.0,
+            model=model or FillModel(fee_rate=FEE_PER_TRADE),
+            log=TradeLog(trade_capacity, trade_log_path),
+        )
+
+    @property
+    def cash(self) -> float:
+        return self.engine.cash
+
+    @property
+    def positions(self) -> dict[str, float]:
+        names = self.engine.symbols.names
+        return dict(zip(names, self.engine.positions[: len(names)].tolist(), strict=True))
+
+    def position(self, symbol: str) -> float:
+        return self.engine.position(symbol)
+
+    @property
+    def trades(self) -> list[Order]:
+        names = self.engine.symbols.names
+        return [
+            Order(
+                symbol=names[r["symbol_id"]],
+                qty=float(r["qty"]),
+                side="buy" if r["side"] == BUY else "sell",
+                price=float(r["price"]),
+            )
+            for r in self.engine.log.recent()
+        ]
 
     def submit_order(self, order: Order) -> dict[str, object]:
-        notional = order.qty * order.price
-        fee = notional * FEE_PER_TRADE
-        if order.side == "buy":
-            self.cash -= notional + fee
-            self.positions[order.symbol] = self.positions.get(order.symbol, 0.0) + order.qty
-        else:
-            cur = self.positions.get(order.symbol, 0.0)
-            qty_to_sell = min(order.qty, max(cur, 0.0))
-            self.cash += qty_to_sell * order.price - fee
-            self.positions[order.symbol] = cur - qty_to_sell
-        self.trades.append(order)
-        return {"status": "filled", "order": order}
+        side = BUY if order.side == "buy" else SELL
+        filled = self.engine.submit_one(
+            self.engine.symbols.id(order.symbol), side, order.qty, order.price
+        )
+        status = "filled" if filled >= order.qty else ("partial" if filled > 0 else "rejected")
+        return {"status": status, "order": order, "filled_qty": filled}
+
+    def submit_orders(self, orders: list[Order]) -> np.ndarray:
+        """Fill many orders in one vectorized batch; returns filled quantities."""
+        return self.engine.submit(
+            [o.symbol for o in orders],
+            np.array([BUY if o.side == "buy" else SELL for o in orders]),
+            np.array([o.qty for o in orders], dtype=float),
+            np.array([o.price for o in orders], dtype=float),
+        )
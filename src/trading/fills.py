@@ -0,0 +1,269 @@
+"""Vectorized order-fill and portfolio accounting engine.
+
+Orders arrive as parallel arrays (symbol id, side, quantity, price) and are
+filled, charged and booked with whole-batch NumPy operations. Positions live
+in a preallocated float64 array indexed by symbol id, and fills go to a
+fixed-size ring buffer (plus an optional append-only binary log on disk), so
+memory stays flat however long a replay runs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+BUY = 1
+SELL = -1
+
+TRADE_DTYPE = np.dtype(
+    [
+        ("seq", "<i8"),
+        ("symbol_id", "<i4"),
+        ("side", "i1"),
+        ("qty", "<f8"),
+        ("price", "<f8"),
+        ("fee", "<f8"),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class FillModel:
+    """Fees, slippage and partial fills applied to every order in a batch.
+
+    ``slippage_bps`` moves the execution price against the order. When a batch
+    carries ``available`` quantities, at most ``participation`` of them is filled.
+    """
+
+    fee_rate: float = 0.0005
+    slippage_bps: float = 0.0
+    participation: float = 1.0
+
+
+class SymbolTable:
+    """Stable symbol -> dense integer id mapping."""
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id(self, symbol: str) -> int:
+        sid = self._ids.get(symbol)
+        if sid is None:
+            sid = self._ids[symbol] = len(self.names)
+            self.names.append(symbol)
+        return sid
+
+    def ids(self, symbols) -> np.ndarray:
+        return np.fromiter((self.id(s) for s in symbols), dtype=np.int64)
+
+
+class TradeLog:
+    """Bounded ring buffer of fills, optionally mirrored to an append-only file."""
+
+    def __init__(self, capacity: int = 1 << 20, path: str | Path | None = None) -> None:
+        self.buffer = np.zeros(capacity, dtype=TRADE_DTYPE)
+        self.total = 0
+        self._file: BinaryIO | None = open(path, "ab") if path is not None else None  # noqa: SIM115
+
+    def append(self, records: np.ndarray) -> None:
+        if self._file is not None:
+            records.tofile(self._file)
+        cap = self.buffer.size
+        n = records.size
+        kept = records[-cap:] if n > cap else records
+        start = (self.total + n - kept.size) % cap
+        head = min(kept.size, cap - start)
+        self.buffer[start : start + head] = kept[:head]
+        self.buffer[: kept.size - head] = kept[head:]
+        self.total += n
+
+    def record(self, symbol_id: int, side: int, qty: float, price: float, fee: float) -> None:
+        """Append a single fill without building a records array."""
+        i = self.total % self.buffer.size
+        self.buffer[i] = (self.total, symbol_id, side, qty, price, fee)
+        if self._file is not None:
+            self.buffer[i : i + 1].tofile(self._file)
+        self.total += 1
+
+    def recent(self) -> np.ndarray:
+        """Retained fills, oldest first."""
+        cap = self.buffer.size
+        if self.total <= cap:
+            return self.buffer[: self.total].copy()
+        start = self.total % cap
+        return np.concatenate([self.buffer[start:], self.buffer[:start]])
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def read(path: str | Path) -> np.ndarray:
+        return np.fromfile(path, dtype=TRADE_DTYPE)
+
+
+def _segment_cummin(values: np.ndarray, group: np.ndarray) -> np.ndarray:
+    """Running minimum that restarts whenever ``group`` (sorted) changes."""
+    # Work on integer ranks so a per-group offset keeps groups apart exactly.
+    n = values.size
+    offset = group.astype(np.int64) * n
+    order = np.argsort(values, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    rank -= offset
+    np.minimum.accumulate(rank, out=rank)
+    return values[order[rank + offset]]
+
+
+class BatchBroker:
+    """Single-account simulator; long-only unless ``allow_short`` is set."""
+
+    def __init__(
+        self,
+        cash: float = 100_000.0,
+        model: FillModel | None = None,
+        capacity: int = 1024,
+        allow_short: bool = False,
+        log: TradeLog | None = None,
+    ) -> None:
+        self.cash = float(cash)
+        self.model = model or FillModel()
+        self.allow_short = allow_short
+        self.symbols = SymbolTable()
+        self.positions = np.zeros(capacity)
+        self.marks = np.full(capacity, np.nan)
+        self.log = log or TradeLog()
+
+    def _ensure_capacity(self, n: int) -> None:
+        if n > self.positions.size:
+            size = max(n, 2 * self.positions.size)
+            self.positions = np.concatenate([self.positions, np.zeros(size - self.positions.size)])
+            self.marks = np.concatenate([self.marks, np.full(size - self.marks.size, np.nan)])
+
+    def _clamp_sells(self, sid: np.ndarray, delta: np.ndarray) -> np.ndarray:
+        """Cap sells at the running position, in submission order within each symbol."""
+        sold = np.bincount(sid, weights=np.minimum(delta, 0.0), minlength=self.positions.size)
+        if np.all(self.positions + sold >= 0.0):
+            return delta  # no symbol can be oversold, whatever the order
+        order = np.argsort(sid, kind="stable")
+        g = sid[order]
+        d = delta[order]
+        new_group = np.r_[True, g[1:] != g[:-1]]
+        starts = np.flatnonzero(new_group)
+        csum = np.cumsum(d)
+        seg_base = np.repeat(csum[starts] - d[starts], np.diff(np.r_[starts, g.size]))
+        level = self.positions[g] + (csum - seg_base)  # unclamped running position
+        # Reflect at zero: p_k = T_k - min(0, min_{j<=k} T_j).
+        floor = np.minimum(_segment_cummin(level, np.cumsum(new_group) - 1), 0.0)
+        after = level - floor
+        before = np.empty_like(after)
+        before[1:] = after[:-1]
+        before[starts] = self.positions[g[starts]]
+        out = np.empty_like(delta)
+        out[order] = after - before
+        return out
+
+    def submit_batch(
+        self,
+        symbol_ids: np.ndarray,
+        sides: np.ndarray,
+        qty: np.ndarray,
+        prices: np.ndarray,
+        available: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Fill a batch of orders; returns the filled quantity of each order.
+
+        Orders are applied in array order. ``sides`` holds BUY (+1) / SELL (-1);
+        ``available`` optionally caps each fill (e.g. displayed liquidity). Only
+        orders with a non-zero fill are written to the trade log.
+        """
+        sid = np.asarray(symbol_ids, dtype=np.int64)
+        side = np.asarray(sides, dtype=np.int8)
+        px = np.asarray(prices, dtype=float)
+        filled = np.maximum(np.asarray(qty, dtype=float), 0.0)
+        if available is not None:
+            filled = np.minimum(
+                filled, self.model.participation * np.asarray(available, dtype=float)
+            )
+        if sid.size == 0:
+            return filled
+        self._ensure_capacity(int(sid.max()) + 1)
+
+        delta = side * filled
+        if not self.allow_short:
+            delta = self._clamp_sells(sid, delta)
+            filled = np.abs(delta)
+
+        exec_px = px * (1.0 + side * (self.model.slippage_bps * 1e-4))
+        notional = filled * exec_px
+        fees = notional * self.model.fee_rate
+        self.cash -= float(delta @ exec_px + fees.sum())
+        self.positions += np.bincount(sid, weights=delta, minlength=self.positions.size)
+        self.marks[sid] = px  # last submitted price per symbol (later orders win)
+
+        hit = filled > 0.0
+        n = int(np.count_nonzero(hit))
+        records = np.empty(n, dtype=TRADE_DTYPE)
+        records["seq"] = np.arange(self.log.total, self.log.total + n)
+        records["symbol_id"] = sid[hit]
+        records["side"] = side[hit]
+        records["qty"] = filled[hit]
+        records["price"] = exec_px[hit]
+        records["fee"] = fees[hit]
+        self.log.append(records)
+        return filled
+
+    def submit_one(
+        self,
+        symbol_id: int,
+        side: int,
+        qty: float,
+        price: float,
+        available: float | None = None,
+    ) -> float:
+        """Scalar :meth:`submit_batch` for a single order; returns the filled quantity."""
+        filled = max(float(qty), 0.0)
+        if available is not None:
+            filled = min(filled, self.model.participation * float(available))
+        self._ensure_capacity(symbol_id + 1)
+        held = float(self.positions[symbol_id])
+        if side == SELL and not self.allow_short:
+            filled = min(filled, max(held, 0.0))
+
+        exec_px = price * (1.0 + side * (self.model.slippage_bps * 1e-4))
+        fee = filled * exec_px * self.model.fee_rate
+        self.cash -= side * filled * exec_px + fee
+        self.positions[symbol_id] = held + side * filled
+        self.marks[symbol_id] = price
+        if filled > 0.0:
+            self.log.record(symbol_id, side, filled, exec_px, fee)
+        return filled
+
+    def submit(self, symbols, sides, qty, prices, available=None) -> np.ndarray:
+        """:meth:`submit_batch` with symbol names instead of ids."""
+        return self.submit_batch(self.symbols.ids(symbols), sides, qty, prices, available)
+
+    def mark_to_market(self, prices: np.ndarray | None = None) -> float:
+        """Account equity: cash plus positions valued at ``prices`` (by symbol id) or last marks."""
+        if prices is not None:
+            n = len(prices)
+            self._ensure_capacity(n)
+            self.marks[:n] = prices
+        held = self.positions != 0.0
+        return self.cash + float(self.positions[held] @ np.nan_to_num(self.marks[held]))
+
+    def position(self, symbol: str) -> float:
+        sid = self.symbols._ids.get(symbol)
+        return 0.0 if sid is None else float(self.positions[sid])
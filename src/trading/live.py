@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from dataclasses import dataclass
 
 from entropy.analyzer import EntropyAnalyzer
+from market.journal import TickJournal
 from market.pipeline import MarketDataPipeline
 from proof.db import ProofCapsuleDB
 from risk.manager import EntropyRiskManager
@@ -12,51 +15,134 @@ from services.metrics import (
     last_price,
     open_position,
 )
-from utils.settings import load_settings
+from utils.settings import AppSettings, SettingsStore, settings_store
 
 from trading.broker import MockBroker, Order
 
 
+@dataclass(frozen=True)
+class SymbolParams:
+    analyzer: EntropyAnalyzer
+    risk: EntropyRiskManager
+
+
+def _analyzer(s: AppSettings, old: EntropyAnalyzer | None) -> EntropyAnalyzer:
+    if old is not None and (old.window, old.p_thresh, old.np_thresh) == (
+        s.entropy_window,
+        s.p_threshold,
+        s.np_threshold,
+    ):
+        return old
+    return EntropyAnalyzer(
+        window=s.entropy_window, p_threshold=s.p_threshold, np_threshold=s.np_threshold
+    )
+
+
+def _risk(s: AppSettings, old: EntropyRiskManager | None) -> EntropyRiskManager:
+    if old is not None and (old.max_position_size, old.entropy_confidence_threshold) == (
+        s.max_position_size,
+        s.entropy_confidence_threshold,
+    ):
+        return old
+    return EntropyRiskManager(
+        max_position_size=s.max_position_size,
+        entropy_confidence_threshold=s.entropy_confidence_threshold,
+    )
+
+
 class EntropyTrader:
-    def __init__(self, broker: MockBroker | None = None, db_url: str | None = None, symbols=None):
-        settings = load_settings()
+    # Ticks of price history kept per symbol beyond the analysis window, so a
+    # hot-reloaded larger window is served from memory instead of re-warming.
+    HISTORY = 256
+
+    def __init__(
+        self,
+        broker: MockBroker | None = None,
+        db_url: str | None = None,
+        symbols=None,
+        journal: TickJournal | None = None,
+        store: SettingsStore | None = None,
+    ):
+        self.store = store or settings_store()
+        settings = self.store.current
         self.broker = broker or MockBroker()
-        self.analyzer = EntropyAnalyzer(
-            window=settings.entropy_window,
-            p_threshold=settings.p_threshold,
-            np_threshold=settings.np_threshold,
-        )
-        self.risk = EntropyRiskManager(
-            max_position_size=settings.max_position_size,
-            entropy_confidence_threshold=settings.entropy_confidence_threshold,
-        )
         self.db = ProofCapsuleDB(db_url or settings.database_url)
         self.pipeline = MarketDataPipeline(symbols=symbols or settings.symbols)
+        if journal is None and settings.journal_dir:
+            journal = TickJournal(settings.journal_dir)
+        self.journal = journal
         self.price_buffers: dict[str, list[float]] = {}
+        self.analyzer = _analyzer(settings, None)
+        self.risk = _risk(settings, None)
+        self.symbol_params: dict[str, SymbolParams] = {}
+        self.settings_version = -1
+        self.apply_settings(*self.store.snapshot())
+
+    def apply_settings(self, version: int, settings: AppSettings) -> None:
+        """Switch every symbol to ``settings`` (with its overrides) in one step.
+
+        Analyzer and risk objects whose parameters did not change are kept.
+        Price buffers are never reset: a new window reads the tail of the
+        retained history, topped up from the journal if that is too short.
+        """
+        self.analyzer = _analyzer(settings, self.analyzer)
+        self.risk = _risk(settings, self.risk)
+        params = {}
+        for symbol in self.pipeline.symbols:
+            s = settings.for_symbol(symbol)
+            old = self.symbol_params.get(symbol)
+            params[symbol] = SymbolParams(
+                analyzer=_analyzer(s, old.analyzer if old else None),
+                risk=_risk(s, old.risk if old else None),
+            )
+        self.history = max([self.HISTORY, *(p.analyzer.window for p in params.values())])
+        self.warm_start_max_age_ns = int(settings.journal_max_age_s * 1e9)
+        for symbol, p in params.items():
+            buf = self.price_buffers.get(symbol)
+            if buf is not None and len(buf) < p.analyzer.window:
+                self.price_buffers[symbol] = self.warm_start(symbol) or buf
+        self.symbol_params = params
+        self.settings_version = version
+
+    def warm_start(self, symbol: str, now_ns: int | None = None) -> list[float]:
+        """Rolling price state for ``symbol`` rebuilt from the journal tail.
+
+        Only ticks younger than ``journal_max_age_s`` are used, so a restart
+        after a gap does not splice a stale session onto live prices.
+        """
+        if self.journal is None:
+            return []
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        since = now_ns - self.warm_start_max_age_ns
+        return self.journal.tail(symbol, self.history, since_ns=since)["price"].tolist()
 
     async def run_live_trading(self) -> None:
         async def run_symbol(symbol: str) -> None:
-            self.price_buffers[symbol] = []
+            self.price_buffers[symbol] = self.warm_start(symbol)
             async for tick in self.pipeline.stream_prices(symbol):
+                if self.store.version != self.settings_version:
+                    self.apply_settings(*self.store.snapshot())
+                params = self.symbol_params[symbol]
+                if self.journal is not None:
+                    self.journal.append(tick)
                 buf = self.price_buffers[symbol]
                 buf.append(tick.price)
-                if len(buf) > self.analyzer.window:
-                    buf.pop(0)
+                if len(buf) > 2 * self.history:
+                    del buf[: -self.history]
                 last_price.labels(symbol=tick.symbol).set(tick.price)
                 broker_cash_gauge.set(self.broker.cash)
-                open_position.labels(symbol=tick.symbol).set(
-                    self.broker.positions.get(tick.symbol, 0.0)
-                )
-                if len(buf) >= self.analyzer.window:
-                    sig = self.analyzer.analyze_entropy_drift(buf)
-                    cap = self.analyzer.generate_proof_capsule(
-                        sig, inputs_fingerprint=f"{symbol}-last{len(buf)}"
+                open_position.labels(symbol=tick.symbol).set(self.broker.position(tick.symbol))
+                window = params.analyzer.window
+                if len(buf) >= window:
+                    sig = params.analyzer.analyze_entropy_drift(buf[-window:])
+                    cap = params.analyzer.generate_proof_capsule(
+                        sig, inputs_fingerprint=f"{symbol}-last{window}"
                     )
                     self.db.store_capsule(symbol, cap)
                     capsules_total.labels(symbol=symbol).inc()
-                    if self.risk.should_execute_trade(sig):
+                    if params.risk.should_execute_trade(sig):
                         acct = self.broker.cash
-                        size = self.risk.calculate_position_size(sig, acct).fraction
+                        size = params.risk.calculate_position_size(sig, acct).fraction
                         if size > 0:
                             notional = acct * size
                             qty = max(notional / tick.price, 0.0)
@@ -66,4 +152,8 @@ class EntropyTrader:
                             )
                 await asyncio.sleep(0)
 
-        await asyncio.gather(*(run_symbol(s) for s in self.pipeline.symbols))
+        try:
+            await asyncio.gather(*(run_symbol(s) for s in self.pipeline.symbols))
+        finally:
+            if self.journal is not None:
+                self.journal.flush()
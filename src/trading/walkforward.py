@@ -0,0 +1,218 @@
+"""Walk-forward optimization of the entropy strategy parameters.
+
+Rolling ΔΦ, slope direction and no-recovery flags are computed once over the
+full series for every candidate parameter value; each fold only slices them.
+The features are trailing, so a slice never looks ahead, and test folds
+start with fully warmed-up features instead of ``window`` empty bars.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from entropy.backends import get_backend
+
+from trading.backtest import CONFIDENCE, HOLD, _performance, entropy_positions
+from trading.robustness import batch_metrics
+
+DEFAULT_GRID: dict[str, tuple[float, ...]] = {
+    "window": (14, 21, 30),
+    "p_threshold": (0.03, 0.045, 0.06),
+    "np_threshold": (0.07, 0.09, 0.12),
+}
+
+Params = tuple[int, float, float]
+
+
+@dataclass(frozen=True)
+class Fold:
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass
+class FoldResult:
+    fold: Fold
+    params: dict[str, float]
+    train_sharpe: float
+    test_sharpe: float
+
+
+@dataclass
+class WalkForwardResult:
+    folds: list[FoldResult]
+    oos_returns: pd.Series
+    equity_curve: pd.Series
+    summary: dict[str, float]
+
+
+def walk_forward_folds(
+    n: int, train_size: int, test_size: int, anchored: bool = False
+) -> list[Fold]:
+    """Consecutive test folds of ``test_size`` bars, each preceded by its train fold.
+
+    Rolling folds train on the ``train_size`` bars before the test fold; anchored
+    folds train on everything from bar 0.
+    """
+    folds = []
+    for test_start in range(train_size, n - test_size + 1, test_size):
+        train_start = 0 if anchored else test_start - train_size
+        folds.append(Fold(train_start, test_start, test_start, test_start + test_size))
+    return folds
+
+
+@dataclass
+class _Features:
+    returns: np.ndarray
+    dphi: dict[int, np.ndarray]
+    direction: dict[int, np.ndarray]
+    no_recovery: dict[tuple[int, float], np.ndarray]
+    hold: int
+    confidence: float
+
+
+def _strategy_returns(f: _Features, params: Params, lo: int, hi: int) -> np.ndarray:
+    """Per-bar strategy returns on [lo, hi); flat at ``lo`` since no prior position carries over."""
+    window, p, npt = params
+    # Kernels are cheap per fold; NumPy keeps workers free of JIT/device start-up.
+    _, pos = entropy_positions(
+        get_backend("numpy"),
+        f.dphi[window][lo:hi],
+        f.no_recovery[(window, p)][lo:hi],
+        f.direction[window][lo:hi],
+        p,
+        npt,
+        f.confidence,
+        f.hold,
+    )
+    out = np.zeros(hi - lo)
+    out[1:] = pos[:-1] * f.returns[lo + 1 : hi]
+    return out
+
+
+def _run_fold(f: _Features, grid: list[Params], fold: Fold) -> tuple[Params, float, np.ndarray]:
+    train = np.stack([_strategy_returns(f, g, fold.train_start, fold.train_end) for g in grid])
+    sharpe = np.nan_to_num(batch_metrics(train)["sharpe"], nan=-np.inf)
+    best = int(np.argmax(sharpe))
+    oos = _strategy_returns(f, grid[best], fold.test_start, fold.test_end)
+    return grid[best], float(sharpe[best]), oos
+
+
+_WORKER_STATE: tuple[_Features, list[Params]] | None = None
+
+
+def _init_worker(features: _Features, grid: list[Params]) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (features, grid)
+
+
+def _run_fold_in_worker(fold: Fold) -> tuple[Params, float, np.ndarray]:
+    assert _WORKER_STATE is not None
+    return _run_fold(*_WORKER_STATE, fold)
+
+
+class EntropyWalkForward:
+    def __init__(
+        self,
+        train_size: int = 504,
+        test_size: int = 126,
+        anchored: bool = False,
+        param_grid: dict[str, tuple[float, ...]] | None = None,
+        backend: str = "numpy",
+        hold: int = HOLD,
+        confidence: float = CONFIDENCE,
+    ):
+        self.train_size = train_size
+        self.test_size = test_size
+        self.anchored = anchored
+        # A partial grid only replaces the parameters it names.
+        self.param_grid = {**DEFAULT_GRID, **(param_grid or {})}
+        if not self._grid():
+            raise ValueError("parameter grid has no combination with np_threshold > p_threshold")
+        self.backend = get_backend(backend)
+        self.hold = hold
+        self.confidence = confidence
+
+    def _grid(self) -> list[Params]:
+        g = self.param_grid
+        return [
+            (int(w), float(p), float(npt))
+            for w, p, npt in itertools.product(g["window"], g["p_threshold"], g["np_threshold"])
+            if npt > p
+        ]
+
+    def _features(self, close: np.ndarray, grid: list[Params]) -> _Features:
+        ret = np.zeros(close.size)
+        ret[1:] = close[1:] / close[:-1] - 1.0
+        windows = sorted({w for w, _, _ in grid})
+        dphi = {w: self.backend.rolling_delta_phi(close, w) for w in windows}
+        direction = {
+            w: np.where(self.backend.rolling_slope(close, w) > 0, 1.0, -1.0) for w in windows
+        }
+        no_rec = {
+            (w, p): self.backend.rolling_no_recovery(dphi[w], w, p)
+            for w, p in {(w, p) for w, p, _ in grid}
+        }
+        return _Features(ret, dphi, direction, no_rec, self.hold, self.confidence)
+
+    def run(
+        self,
+        historical_data: pd.DataFrame,
+        start_capital: float = 100000,
+        n_jobs: int | None = None,
+    ) -> WalkForwardResult:
+        close = historical_data["close"].astype(float).to_numpy()
+        folds = walk_forward_folds(close.size, self.train_size, self.test_size, self.anchored)
+        if not folds:
+            raise ValueError("not enough bars for one train/test fold")
+        grid = self._grid()
+        features = self._features(close, grid)
+
+        workers = min(n_jobs or os.cpu_count() or 1, len(folds))
+        if workers <= 1:
+            outcomes = [_run_fold(features, grid, fold) for fold in folds]
+        else:
+            # Spawned, like trading.robustness: forking after Numba/CuPy start-up can hang.
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=ctx,
+                initializer=_init_worker,
+                initargs=(features, grid),
+            ) as pool:
+                outcomes = list(pool.map(_run_fold_in_worker, folds))
+
+        results = []
+        for fold, (params, train_sharpe, oos) in zip(folds, outcomes, strict=True):
+            test_sharpe = float(batch_metrics(oos)["sharpe"][0])
+            results.append(
+                FoldResult(
+                    fold=fold,
+                    params={
+                        "window": params[0],
+                        "p_threshold": params[1],
+                        "np_threshold": params[2],
+                    },
+                    train_sharpe=train_sharpe,
+                    test_sharpe=test_sharpe,
+                )
+            )
+
+        index = historical_data.index[folds[0].test_start : folds[-1].test_end]
+        oos_returns = pd.Series(np.concatenate([o for _, _, o in outcomes]), index=index)
+        # Each test fold opens flat, so the first stitched bar is exactly start_capital.
+        equity = start_capital * (1.0 + oos_returns).cumprod()
+        return WalkForwardResult(
+            folds=results,
+            oos_returns=oos_returns,
+            equity_curve=equity,
+            summary=_performance(equity),
+        )
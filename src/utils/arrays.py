@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import importlib
+from functools import cache
 
 
+@cache
 def xp():
+    """Resolve the array module once per process: CuPy when importable, else NumPy."""
     try:
-        import cupy  # noqa: F401
-
         return importlib.import_module("cupy")
     except Exception:
-        import numpy
-
-        return numpy
+        return importlib.import_module("numpy")
 
 
 def asarray(a):
@@ -19,13 +18,11 @@ def asarray(a):
 
 
 def to_numpy(a):
-    try:
-        import cupy
-
-        if isinstance(a, cupy.ndarray):
-            return cupy.asnumpy(a)
-    except Exception:
-        pass
     import numpy as np
 
-    return a if isinstance(a, np.ndarray) else np.asarray(a)
+    if isinstance(a, np.ndarray):
+        return a
+    mod = xp()
+    if mod is not np and isinstance(a, mod.ndarray):
+        return mod.asnumpy(a)
+    return np.asarray(a)
@@ -1,10 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 import os
+from functools import lru_cache
+from typing import Any
 
 import yaml  # type: ignore[import-untyped]
+from pydantic import BaseModel, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+SETTINGS_PATH = "config/settings.yaml"
+
+# (yaml section, key) -> AppSettings field
+_YAML_FIELDS = {
+    ("entropy", "window"): "entropy_window",
+    ("entropy", "p_threshold"): "p_threshold",
+    ("entropy", "np_threshold"): "np_threshold",
+    ("risk", "max_position_size"): "max_position_size",
+    ("risk", "entropy_confidence_threshold"): "entropy_confidence_threshold",
+    ("backtest", "start_capital"): "start_capital",
+    ("database", "url"): "database_url",
+    ("journal", "dir"): "journal_dir",
+    ("journal", "max_age_s"): "journal_max_age_s",
+    ("service", "host"): "service_host",
+    ("service", "port"): "service_port",
+}
+
+
+class SymbolOverrides(BaseModel):
+    """Per-symbol entropy and risk parameters; unset fields fall back to the globals."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    entropy_window: int | None = None
+    p_threshold: float | None = None
+    np_threshold: float | None = None
+    max_position_size: float | None = None
+    entropy_confidence_threshold: float | None = None
+
 
 class AppSettings(BaseSettings):
     symbols: list[str] = ["SPY", "QQQ", "VTI", "BTC-USD", "ETH-USD"]
@@ -16,31 +49,117 @@ class AppSettings(BaseSettings):
     entropy_confidence_threshold: float = 0.85
     start_capital: int = 100_000
     database_url: str = "sqlite:///./entropy_capsules.db"
+    journal_dir: str = ""  # empty disables the tick journal
+    journal_max_age_s: float = 900.0  # older journal ticks are not used to warm-start
     service_host: str = "0.0.0.0"
     service_port: int = 8000
+    symbol_overrides: dict[str, SymbolOverrides] = {}
 
-    model_config = SettingsConfigDict(env_prefix="ENTROPY_", env_file=".env", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_prefix="ENTROPY_", env_file=".env", extra="ignore", frozen=True
+    )
 
+    def for_symbol(self, symbol: str) -> AppSettings:
+        """These settings with ``symbol``'s overrides applied."""
+        ov = self.symbol_overrides.get(symbol)
+        if ov is None:
+            return self
+        return self.model_copy(update=ov.model_dump(exclude_none=True))
 
-def load_settings() -> AppSettings:
+
+def _fields(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        field: data[section][key]
+        for (section, key), field in _YAML_FIELDS.items()
+        if isinstance(data.get(section), dict) and key in data[section]
+    }
+
+
+def load_settings(path: str = SETTINGS_PATH) -> AppSettings:
     s = AppSettings()
-    yml = "config/settings.yaml"
-    if os.path.exists(yml):
-        with open(yml) as f:
+    if os.path.exists(path):
+        with open(path) as f:
             data = yaml.safe_load(f) or {}
         s = AppSettings(
             symbols=data.get("symbols", s.symbols),
             sources=data.get("sources", s.sources),
-            entropy_window=data.get("entropy", {}).get("window", s.entropy_window),
-            p_threshold=data.get("entropy", {}).get("p_threshold", s.p_threshold),
-            np_threshold=data.get("entropy", {}).get("np_threshold", s.np_threshold),
-            max_position_size=data.get("risk", {}).get("max_position_size", s.max_position_size),
-            entropy_confidence_threshold=data.get("risk", {}).get(
-                "entropy_confidence_threshold", s.entropy_confidence_threshold
-            ),
-            start_capital=data.get("backtest", {}).get("start_capital", s.start_capital),
-            database_url=data.get("database", {}).get("url", s.database_url),
-            service_host=data.get("service", {}).get("host", s.service_host),
-            service_port=data.get("service", {}).get("port", s.service_port),
+            symbol_overrides={
+                sym: SymbolOverrides(**_fields(ov or {}))
+                for sym, ov in (data.get("overrides") or {}).items()
+            },
+            **_fields(data),
         )
     return s
+
+
+class SettingsStore:
+    """Versioned in-memory settings with polling hot reload.
+
+    :attr:`current` and :attr:`version` are plain attribute reads, so hot paths
+    can check for a new version on every tick without touching the filesystem.
+    Only :meth:`reload` / :meth:`watch` read the YAML file; a file that fails to
+    load leaves the previous version in place.
+    """
+
+    def __init__(self, path: str = SETTINGS_PATH) -> None:
+        self.path = path
+        self.last_error: str | None = None
+        self._stamp = self._stat()
+        self._snapshot = (0, load_settings(path))
+
+    @property
+    def version(self) -> int:
+        return self._snapshot[0]
+
+    @property
+    def current(self) -> AppSettings:
+        return self._snapshot[1]
+
+    def snapshot(self) -> tuple[int, AppSettings]:
+        """(version, settings), read together."""
+        return self._snapshot
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def reload(self) -> bool:
+        """Re-read the file; publish and return True if the settings changed."""
+        self._stamp = self._stat()
+        new = load_settings(self.path)
+        version, old = self._snapshot
+        if new == old:
+            return False
+        self._snapshot = (version + 1, new)
+        return True
+
+    def poll(self) -> bool:
+        """:meth:`reload` if the file changed on disk since the last read."""
+        if self._stat() == self._stamp:
+            return False
+        try:
+            changed = self.reload()
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        self.last_error = None
+        return changed
+
+    async def watch(self, interval: float = 1.0) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.poll()
+
+
+@lru_cache(maxsize=1)
+def settings_store() -> SettingsStore:
+    """Process-wide store; ``settings_store.cache_clear()`` drops it so the next call re-reads."""
+    return SettingsStore()
+
+
+def get_settings() -> AppSettings:
+    """Current settings snapshot, served from memory."""
+    return settings_store().current
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from entropy.backends import available_backends, get_backend
+
+
+def _naive_no_recovery(dphi, window, p):
+    out = np.zeros(dphi.size, dtype=bool)
+    for i in range(window - 1, dphi.size):
+        finite = dphi[i - window + 1 : i + 1]
+        finite = finite[np.isfinite(finite)]
+        out[i] = finite.size > 0 and finite.min() >= p
+    return out
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backend_kernels_agree_with_reference(name):
+    rng = np.random.default_rng(7)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+    window = 21
+    backend = get_backend(name)
+
+    dphi = backend.rolling_delta_phi(prices, window)
+    ref = get_backend("numpy").rolling_delta_phi(prices, window)
+    np.testing.assert_allclose(dphi, ref, equal_nan=True)
+
+    no_rec = backend.rolling_no_recovery(dphi, window, 0.045)
+    np.testing.assert_array_equal(no_rec, _naive_no_recovery(dphi, window, 0.045))
+
+    x = np.arange(window, dtype=float)
+    slope = backend.rolling_slope(prices, window)
+    y = prices[-window:]
+    expected = np.cov(x, y, bias=True)[0, 1] / (np.var(x) + 1e-12)
+    assert slope[-1] == pytest.approx(expected)
+
+    trigger = np.zeros(12, dtype=bool)
+    trigger[[1, 3, 10]] = True
+    direction = np.array([0, 1, 0, -1, 0, 0, 0, 0, 0, 0, 1, 0], dtype=float)
+    pos = backend.position_scan(trigger, direction, 3)
+    np.testing.assert_array_equal(pos, [0, 1, 1, -1, -1, -1, 0, 0, 0, 0, 1, 1])
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        get_backend("abacus")
+
+
+def _reference_backtest(close, window=21, p=0.045, npt=0.09, hold=5, start=100_000.0):
+    """The original per-bar loop implementation of EntropyBacktester."""
+    from entropy.analyzer import EntropyAnalyzer
+
+    n = close.size
+    dphi = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        w = close[i - window + 1 : i + 1]
+        dphi[i] = (w.max() - w.min()) / max(abs(w.max()), 1e-9)
+    no_rec = _naive_no_recovery(dphi, window, p)
+    conf = np.clip((dphi - p) / max(npt - p, 1e-9), 0, 1)
+    conf[~np.isfinite(conf)] = 0.0
+    pos = np.zeros(n)
+    signals = []
+    analyzer = EntropyAnalyzer(window=window, p_threshold=p, np_threshold=npt)
+    for i in range(window - 1, n):
+        if conf[i] >= 0.85 and (dphi[i] > npt or no_rec[i]):
+            x = np.arange(window, dtype=float)
+            y = close[i - window + 1 : i + 1]
+            slope = np.cov(x, y, bias=True)[0, 1] / (np.var(x) + 1e-12)
+            pos[i : min(i + hold, n)] = 1.0 if slope > 0 else -1.0
+            signals.append(analyzer.analyze_entropy_drift(close[: i + 1]))
+    ret = np.concatenate([[0.0], close[1:] / close[:-1] - 1.0])
+    equity = np.concatenate([[start], start * np.cumprod(1.0 + pos[:-1] * ret[1:])])
+    return equity, signals
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backtester_matches_reference_loop(name):
+    import pandas as pd
+
+    from trading.backtest import EntropyBacktester
+
+    rng = np.random.default_rng(11)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.03, 300)))
+    res = EntropyBacktester(backend=name).backtest_entropy_strategy(pd.DataFrame({"close": close}))
+    equity, signals = _reference_backtest(close)
+    assert signals, "fixture should trigger trades"
+    np.testing.assert_allclose(res.equity_curve.to_numpy(), equity)
+    assert res.signals == signals
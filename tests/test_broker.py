@@ -0,0 +1,76 @@
+import numpy as np
+
+from trading.broker import MockBroker, Order
+from trading.fills import BUY, SELL, BatchBroker, FillModel, TradeLog
+
+
+def _sequential(sid, side, qty, px, fee):
+    pos: dict[int, float] = {}
+    cash, fills = 0.0, []
+    for s, sd, q, p in zip(sid, side, qty, px, strict=True):
+        cur = pos.get(s, 0.0)
+        f = q if sd == BUY else min(q, max(cur, 0.0))
+        pos[s] = cur + sd * f
+        cash -= sd * f * p + f * p * fee
+        fills.append(f)
+    return np.array(fills), pos, cash
+
+
+def test_batch_matches_order_by_order_fills():
+    rng = np.random.default_rng(0)
+    n = 500
+    sid = rng.integers(0, 6, n)
+    side = np.where(rng.random(n) < 0.5, BUY, SELL)
+    qty = rng.integers(1, 10, n).astype(float)
+    px = rng.uniform(10, 20, n)
+    broker = BatchBroker(cash=0.0, capacity=2)
+    filled = broker.submit_batch(sid, side, qty, px)
+    ref_fills, ref_pos, ref_cash = _sequential(sid, side, qty, px, broker.model.fee_rate)
+    np.testing.assert_allclose(filled, ref_fills)
+    np.testing.assert_allclose(broker.positions[:6], [ref_pos.get(i, 0.0) for i in range(6)])
+    assert abs(broker.cash - ref_cash) < 1e-6
+    # Rejected (zero-fill) orders never reach the trade log.
+    np.testing.assert_allclose(broker.log.recent()["qty"], ref_fills[ref_fills > 0])
+
+    one = BatchBroker(cash=0.0, capacity=2)
+    got = [
+        one.submit_one(int(s), int(d), q, p) for s, d, q, p in zip(sid, side, qty, px, strict=True)
+    ]
+    np.testing.assert_allclose(got, ref_fills)
+    np.testing.assert_allclose(one.positions, broker.positions)
+    assert abs(one.cash - ref_cash) < 1e-6
+    np.testing.assert_array_equal(one.log.recent(), broker.log.recent())
+
+
+def test_slippage_partial_fills_and_mark_to_market():
+    broker = BatchBroker(
+        cash=1000.0, model=FillModel(fee_rate=0.0, slippage_bps=100, participation=0.5)
+    )
+    filled = broker.submit(
+        ["A", "B"], [BUY, BUY], [10.0, 10.0], [10.0, 20.0], available=[8.0, 100.0]
+    )
+    np.testing.assert_allclose(filled, [4.0, 10.0])
+    assert broker.cash == 1000.0 - 4 * 10.1 - 10 * 20.2
+    assert broker.mark_to_market(np.array([11.0, 20.0])) == broker.cash + 4 * 11.0 + 10 * 20.0
+
+
+def test_trade_log_is_bounded_and_mirrored_to_disk(tmp_path):
+    path = tmp_path / "fills.bin"
+    log = TradeLog(capacity=4, path=path)
+    broker = BatchBroker(log=log)
+    broker.submit(["A"] * 3, [BUY] * 3, [1.0] * 3, [1.0] * 3)
+    broker.submit(["A"] * 3, [BUY] * 3, [1.0] * 3, [1.0] * 3)
+    log.close()
+    assert log.recent()["seq"].tolist() == [2, 3, 4, 5]
+    assert TradeLog.read(path)["seq"].tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_mock_broker_facade():
+    broker = MockBroker(trade_capacity=2)
+    assert broker.submit_order(Order("SPY", 10, "buy", 100.0))["status"] == "filled"
+    res = broker.submit_order(Order("SPY", 15, "sell", 110.0))
+    assert res["status"] == "partial" and res["filled_qty"] == 10
+    assert broker.submit_order(Order("QQQ", 1, "sell", 50.0))["status"] == "rejected"
+    assert broker.positions == {"SPY": 0.0, "QQQ": 0.0}
+    assert [(t.symbol, t.side) for t in broker.trades] == [("SPY", "buy"), ("SPY", "sell")]
+    assert broker.cash == 100_000.0 - 1000 * 1.0005 + 1100 * 0.9995
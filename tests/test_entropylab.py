@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from entropylab import backtest
+
+
+def _wide(n_bars=400, n_assets=6, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_assets)), axis=0))
+    return pd.DataFrame(prices, index=pd.bdate_range("2010-01-01", periods=n_bars))
+
+
+def _reference(prices: pd.Series, rf: float) -> dict:
+    """The original single-series implementation (pct_change / cummax), kept as an oracle."""
+    prices = prices.dropna().astype(float)
+    if prices.size < 3:
+        return dict.fromkeys(["sharpe", "cagr", "total_return", "max_drawdown"], 0.0) | {
+            "trades": 0
+        }
+    rets = prices.pct_change().dropna()
+    freq = prices.index.inferred_freq if isinstance(prices.index, pd.DatetimeIndex) else None
+    ppy = 52.0 if freq and "W" in freq.upper() else 252.0
+    excess = rets - ((1 + rf) ** (1 / ppy) - 1)
+    vol = excess.std()
+    nav = (1 + rets).cumprod()
+    years = ((prices.index[-1] - prices.index[0]).days or 1) / 365.25
+    return {
+        "sharpe": round(float(excess.mean() / vol * np.sqrt(ppy)) if vol > 0 else 0.0, 4),
+        "cagr": round(float((prices.iloc[-1] / prices.iloc[0]) ** (1 / years) - 1), 6),
+        "total_return": round(float(nav.iloc[-1] - 1), 6),
+        "max_drawdown": round(float((nav / nav.cummax() - 1).min()), 6),
+        "trades": 0,
+    }
+
+
+def _assert_close(got: dict, want: dict) -> None:
+    assert got.keys() == want.keys()
+    for k in want:
+        assert abs(got[k] - want[k]) <= 2e-6 * max(1.0, abs(want[k])), (k, got[k], want[k])
+
+
+@pytest.mark.parametrize("freq", ["B", "W"])
+def test_frame_and_series_match_reference(freq):
+    df = _wide()
+    df.index = pd.date_range("2010-01-01", periods=len(df), freq=freq)
+    df.iloc[:50, 1] = np.nan  # late listing
+    df.iloc[[10, 11, 200], 2] = np.nan  # gaps (weekly: the column's own index has no freq)
+    df.iloc[350:, 3] = np.nan  # delisting
+    table = backtest(df, risk_free_annual=0.01)
+    assert list(table.index) == list(df.columns)
+    for col in df:
+        want = _reference(df[col], 0.01)
+        _assert_close(table.loc[col].to_dict(), want)
+        _assert_close(backtest(df[col], risk_free_annual=0.01), want)
+
+
+def test_ndarray_input_and_quiet_by_default(capsys):
+    values = _wide().to_numpy()
+    table = backtest(values)
+    assert table.shape == (6, 5)
+    one = backtest(values[:, 0])
+    assert one["sharpe"] == table.loc[0, "sharpe"]
+    assert capsys.readouterr().out == ""
+    backtest(pd.Series(values[:, 0]), verbose=True)
+    assert "Sharpe (entropylab)" in capsys.readouterr().out
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+
+import numpy as np
+
+from market.journal import SOURCES, TICK_DTYPE, TickJournal
+from market.types import MarketTick, to_ns
+from trading.live import EntropyTrader
+
+DAY_NS = 86_400 * 10**9
+T0 = to_ns(datetime(2024, 3, 1, 23, 59, tzinfo=UTC))
+
+
+def test_append_read_roundtrip_grows_and_splits_by_day(tmp_path):
+    journal = TickJournal(tmp_path, segment_capacity=4)
+    ts = T0 + np.arange(10) * 10**9
+    for i, t in enumerate(ts):
+        journal.write("SPY", int(t), 100.0 + i, "polygon_io")
+    journal.write("QQQ", int(T0 + DAY_NS), 50.0)
+    journal.append(MarketTick("SPY", datetime(2024, 3, 2, 0, 5, tzinfo=UTC), 200.0, "simulated"))
+    journal.close()
+
+    assert journal.days("SPY") == ["20240301", "20240302"]
+    first = journal.read("SPY", "20240301")
+    assert first.dtype == TICK_DTYPE and isinstance(first.base, np.memmap)
+    np.testing.assert_array_equal(first["ts_ns"], ts)
+    np.testing.assert_array_equal(first["price"], 100.0 + np.arange(10))
+    assert set(first["source"].tolist()) == {SOURCES.index("polygon_io")}
+    latest = journal.read("SPY")
+    assert latest["price"].tolist() == [200.0]
+    assert journal.read("QQQ")["symbol_id"].tolist() == [journal.symbol_ids["QQQ"]]
+
+
+def test_tail_spans_segments_and_survives_reopen(tmp_path):
+    journal = TickJournal(tmp_path)
+    for i in range(5):
+        journal.write("BTC-USD", T0 + i * 10**9, float(i))
+    journal.write("BTC-USD", T0 + DAY_NS, 5.0)
+    journal.flush()
+
+    reopened = TickJournal(tmp_path)
+    assert reopened.symbol_ids == journal.symbol_ids
+    assert reopened.tail("BTC-USD", 3)["price"].tolist() == [3.0, 4.0, 5.0]
+    assert reopened.tail("BTC-USD", 100).size == 6
+    assert reopened.tail("ETH-USD", 3).size == 0
+    assert reopened.tail("BTC-USD", 0).size == 0
+    assert reopened.tail("BTC-USD", 100, since_ns=T0 + 3 * 10**9)["price"].tolist() == [3, 4, 5]
+    assert reopened.tail("BTC-USD", 100, since_ns=T0 + DAY_NS).size == 1
+    # Appending to an existing segment continues after the committed records.
+    reopened.write("BTC-USD", T0 + DAY_NS + 1, 6.0)
+    assert reopened.read("BTC-USD")["price"].tolist() == [5.0, 6.0]
+
+
+def test_trader_warm_starts_from_journal_tail(tmp_path):
+    journal = TickJournal(tmp_path / "journal")
+    for i in range(30):
+        journal.write("SPY", T0 + i * 10**9, 100.0 + i)
+    trader = EntropyTrader(
+        db_url=f"sqlite:///{tmp_path / 'caps.db'}", symbols=["SPY"], journal=journal
+    )
+    now = T0 + 30 * 10**9
+    assert trader.warm_start("SPY", now) == [100.0 + i for i in range(30)]
+    assert trader.warm_start("QQQ", now) == []
+    # A journal from an earlier session is too old to seed live buffers.
+    assert trader.warm_start("SPY", now + 3600 * 10**9) == []
+    assert trader.warm_start("SPY") == []
@@ -0,0 +1,128 @@
+import numpy as np
+from sqlalchemy import select
+
+from entropy.analyzer import EntropyAnalyzer, EntropySignal
+from proof.db import HISTOGRAM_BINS, ProofCapsuleDB, _quantiles
+
+MIN_NS = 60 * 10**9
+T0 = 1_700_000_000 // 86_400 * 86_400 * 10**9  # midnight, so every bucket below holds all rows
+
+
+def _capsules(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    analyzer = EntropyAnalyzer()
+    out = []
+    for i in range(n):
+        dphi = float(rng.uniform(0.0, 0.2)) if i % 17 else float("nan")
+        sig = EntropySignal(
+            np_wall=bool(dphi > 0.09),
+            no_recovery=bool(rng.random() < 0.3),
+            delta_phi=dphi,
+            p_threshold=0.045,
+            np_threshold=0.09,
+            window=21,
+            confidence=float(rng.random()),
+            direction=1,
+        )
+        cap = analyzer.generate_proof_capsule(sig, inputs_fingerprint=str(i))
+        ts = T0 + int(rng.integers(0, 180)) * MIN_NS + int(rng.integers(0, MIN_NS))
+        out.append(("SPY" if i % 3 else "QQQ", cap.model_copy(update={"timestamp_ns": ts})))
+    return out
+
+
+def _raw(db, symbol, interval):
+    counts: dict[int, list[int]] = {}
+    with db.engine.connect() as conn:
+        for r in conn.execute(select(db.capsules).where(db.capsules.c.symbol == symbol)):
+            b = r.timestamp_ns - r.timestamp_ns % interval
+            sig = r.payload["signal"]
+            sat = r.payload["sat_provenance"]["verdict"] == "SAT"
+            acc = counts.setdefault(b, [0, 0, 0, 0, 0])
+            for k, v in enumerate((1, sig["np_wall"], sig["no_recovery"], sat, not sat)):
+                acc[k] += int(v)
+    return counts
+
+
+def test_rollups_match_raw_capsules_and_rebuild(tmp_path):
+    db = ProofCapsuleDB(f"sqlite:///{tmp_path / 'caps.db'}")
+    caps = _capsules()
+    for sym, cap in caps:
+        db.store_capsule(sym, cap)
+
+    hour = 3600 * 10**9
+    rows = db.interval_counts(hour, symbol="SPY")
+    assert {
+        r["bucket_ns"]: [r[k] for k in ("count", "np_wall", "no_recovery", "sat", "undecided")]
+        for r in rows
+    } == _raw(db, "SPY", hour)
+
+    hist = db.histogram("delta_phi")
+    finite = [c.signal.delta_phi for _, c in caps if np.isfinite(c.signal.delta_phi)]
+    assert len(hist["counts"]) == HISTOGRAM_BINS
+    assert hist["counts"] == np.histogram(finite, bins=hist["edges"])[0].tolist()
+
+    ratios = db.verdict_ratios()
+    assert sum(v["sat"] + v["undecided"] for v in ratios.values()) == len(caps)
+
+    before = (rows, hist, db.percentiles("confidence", [0.5], hour))
+    db.rebuild_rollups()
+    after = (
+        db.interval_counts(hour, symbol="SPY"),
+        db.histogram("delta_phi"),
+        db.percentiles("confidence", [0.5], hour),
+    )
+    assert before == after
+
+
+def test_percentiles_within_one_bin(tmp_path):
+    db = ProofCapsuleDB(f"sqlite:///{tmp_path / 'caps.db'}")
+    caps = _capsules(600, seed=1)
+    for sym, cap in caps:
+        db.store_capsule(sym, cap)
+    (row,) = db.percentiles("confidence", [0.1, 0.5, 0.9], 4 * 3600 * 10**9, symbol="QQQ")
+    conf = [c.signal.confidence for s, c in caps if s == "QQQ"]
+    assert row["count"] == len(conf)
+    for q, v in row["values"].items():
+        assert abs(v - np.quantile(conf, q)) <= 2.0 / HISTOGRAM_BINS
+
+
+def test_existing_database_is_backfilled(tmp_path):
+    url = f"sqlite:///{tmp_path / 'caps.db'}"
+    db = ProofCapsuleDB(url)
+    for sym, cap in _capsules(50):
+        db.store_capsule(sym, cap)
+    with db.engine.begin() as conn:
+        conn.execute(db.rollups.delete())
+        conn.execute(db.histograms.delete())
+    assert sum(r["count"] for r in ProofCapsuleDB(url).interval_counts(MIN_NS)) == 50
+
+
+def test_coarse_tiers_match_base_buckets(tmp_path):
+    db = ProofCapsuleDB(f"sqlite:///{tmp_path / 'caps.db'}")
+    for sym, cap in _capsules(200, seed=2):
+        db.store_capsule(sym, cap)
+    assert [t for t, _, _ in db.tiers] == [MIN_NS, 3600 * 10**9, 86_400 * 10**9]
+    _, hour_rollups, hour_hist = db.tiers[1]
+    assert db._tier(2 * 3600 * 10**9, T0, None) == (hour_rollups, hour_hist)
+    assert db._tier(86_400 * 10**9)[1] is db.tiers[2][2]
+    assert db._tier(90 * MIN_NS) == (db.rollups, db.histograms)
+
+    def queries(q):
+        return (
+            q.interval_counts(3600 * 10**9, start_ns=T0),
+            q.histogram("confidence", end_ns=T0 + 86_400 * 10**9),
+            q.percentiles("delta_phi", [0.0, 0.5, 1.0], 86_400 * 10**9),
+        )
+
+    # Queries served by a coarse tier equal the same queries forced onto the base buckets.
+    base = ProofCapsuleDB(f"sqlite:///{tmp_path / 'caps.db'}")
+    base.tiers = base.tiers[:1]
+    assert queries(db) == queries(base)
+
+
+def test_zero_quantile_skips_empty_leading_bins():
+    counts = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+    counts[[10, 50]] = [3, 1]
+    lo, mid, hi = _quantiles(counts, np.array([0.0, 0.5, 1.0]))
+    assert lo == 10 / HISTOGRAM_BINS and 10 / HISTOGRAM_BINS < mid <= 11 / HISTOGRAM_BINS
+    assert hi == 51 / HISTOGRAM_BINS
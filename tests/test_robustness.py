@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.backtest import EntropyBacktester, _performance
+from trading.robustness import analyze_backtest, batch_metrics, robustness_report
+
+
+def test_batch_metrics_match_single_path_performance():
+    rng = np.random.default_rng(3)
+    r = rng.normal(0.0005, 0.01, (4, 300))
+    out = batch_metrics(r)
+    for i in range(r.shape[0]):
+        equity = pd.Series(np.concatenate([[1.0], np.cumprod(1.0 + r[i])]))
+        ref = _performance(equity)
+        assert out["ann_return"][i] == pytest.approx(ref["ann_return"])
+        assert out["ann_vol"][i] == pytest.approx(ref["ann_vol"])
+        assert out["sharpe"][i] == pytest.approx(ref["sharpe"])
+        assert out["max_dd"][i] == pytest.approx(ref["max_dd"])
+
+
+def test_report_is_seeded_and_independent_of_workers():
+    rng = np.random.default_rng(5)
+    r = rng.normal(0.002, 0.01, 500)
+    a = robustness_report(r, n_resamples=400, chunk_size=100, seed=11, n_jobs=1)
+    b = robustness_report(r, n_resamples=400, chunk_size=100, seed=11, n_jobs=2)
+    pd.testing.assert_frame_equal(a.to_frame(), b.to_frame())
+    sharpe = a.metrics["sharpe"]
+    assert sharpe.ci_low < sharpe.observed < sharpe.ci_high
+    assert sharpe.p_value < 0.05
+
+
+def test_analyze_backtest_uses_random_entry_null():
+    rng = np.random.default_rng(9)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 600)))
+    res = EntropyBacktester(backend="numpy").backtest_entropy_strategy(
+        pd.DataFrame({"close": close})
+    )
+    report = analyze_backtest(res, n_resamples=200, seed=0, n_jobs=1)
+    assert report.null == "random_entry"
+    assert set(report.to_frame().columns) == {"observed", "ci_low", "ci_high", "p_value"}
+
+
+def test_demeaned_null_does_not_test_volatility():
+    r = np.random.default_rng(1).normal(0.001, 0.01, 300)
+    report = robustness_report(r, n_resamples=100, seed=0, n_jobs=1)
+    assert np.isnan(report.metrics["ann_vol"].p_value)
+
+
+def test_non_finite_bars_are_dropped_from_all_inputs():
+    rng = np.random.default_rng(2)
+    mkt = rng.normal(0.0, 0.01, 300)
+    pos = np.sign(rng.normal(size=300))
+    r = pos * mkt
+    r[10] = np.nan
+    report = robustness_report(
+        r, positions=pos, market_returns=mkt, n_resamples=100, seed=0, n_jobs=1
+    )
+    assert all(np.isfinite(s.p_value) for s in report.metrics.values())
+    with pytest.raises(ValueError):
+        robustness_report(r, positions=pos[:1], market_returns=mkt[:1], n_resamples=10)
+
+
+def test_pooled_report_after_numba_kernels_exits_cleanly(tmp_path):
+    # Forked workers from a process running Numba's thread pool used to hang at exit.
+    pytest.importorskip("numba")
+    script = tmp_path / "run.py"
+    script.write_text(
+        "import numpy as np\n"
+        "from entropy.backends import get_backend\n"
+        "from trading.robustness import robustness_report\n"
+        "x = np.random.default_rng(0).normal(0, 0.01, 500)\n"
+        "get_backend('numba').rolling_delta_phi(100 + x.cumsum(), 21)\n"
+        "if __name__ == '__main__':\n"
+        "    robustness_report(x, n_resamples=200, chunk_size=50, seed=0, n_jobs=2)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, str(script)], env=env, check=True, timeout=120)
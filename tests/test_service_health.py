@@ -8,3 +8,66 @@ def test_health():
     r = client.get("/health")
     assert r.status_code == 200
     assert r.json().get("ok") is True
+
+
+def test_lifespan_builds_trader(tmp_path, monkeypatch):
+    from utils.settings import settings_store
+
+    monkeypatch.chdir(tmp_path)
+    settings_store.cache_clear()
+    stale = getattr(app.state, "trader", None)  # left behind by earlier lifespans, if any
+    with TestClient(app) as client:
+        from trading.live import EntropyTrader
+
+        trader = app.state.trader
+        assert isinstance(trader, EntropyTrader) and trader is not stale
+        assert trader.db.engine.url.database == "./entropy_capsules.db"
+        assert client.get("/health").status_code == 200
+        assert (
+            client.post("/proofs/query", json={"symbol": "SPY", "entropy_range": [0, 1]}).json()
+            == []
+        )
+    assert (tmp_path / "entropy_capsules.db").exists()
+    settings_store.cache_clear()
+
+
+def test_analytics_endpoints(tmp_path, monkeypatch):
+    from test_proof_db import _capsules
+
+    from utils.settings import settings_store
+
+    monkeypatch.chdir(tmp_path)
+    settings_store.cache_clear()
+    with TestClient(app) as client:
+        db = app.state.trader.db
+        for sym, cap in _capsules(40):
+            db.store_capsule(sym, cap)
+        hist = client.get("/analytics/histogram/confidence", params={"symbol": "SPY"}).json()
+        assert sum(hist["counts"]) == sum(1 for s, _ in _capsules(40) if s == "SPY")
+        counts = client.get("/analytics/counts", params={"interval_s": 86400}).json()
+        assert sum(r["count"] for r in counts) == 40
+        assert set(client.get("/analytics/verdicts").json()) == {"SPY", "QQQ"}
+        pct = client.get("/analytics/percentiles/delta_phi", params={"q": [0.5, 0.9]}).json()
+        assert all(len(r["values"]) == 2 for r in pct)
+        assert client.get("/analytics/counts", params={"interval_s": 90}).status_code == 400
+        assert client.get("/analytics/histogram/price").status_code == 422
+    settings_store.cache_clear()
+
+
+def test_price_websocket_formats(tmp_path, monkeypatch):
+    import json
+
+    from services.wire import decode_binary
+    from utils.settings import settings_store
+
+    monkeypatch.chdir(tmp_path)
+    settings_store.cache_clear()
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/prices/SPY") as ws:
+            assert set(ws.receive_json()) == {"symbol", "ts", "price"}
+        url = "/ws/prices?symbols=SPY,QQQ&format=binary&flush_ms=120"
+        with client.websocket_connect(url) as ws:
+            assert json.loads(ws.receive_text())["symbols"] == ["SPY", "QQQ"]
+            records = decode_binary(ws.receive_bytes())
+            assert records.size >= 2 and set(records["symbol"].tolist()) == {0, 1}
+    settings_store.cache_clear()
@@ -0,0 +1,78 @@
+import asyncio
+import os
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+
+from market.types import MarketTick
+from trading.live import EntropyTrader
+from utils.settings import SettingsStore, load_settings
+
+BASE = """
+symbols: ["SPY", "BTC-USD"]
+entropy: {window: 21, p_threshold: 0.045, np_threshold: 0.09}
+overrides:
+  BTC-USD:
+    entropy: {window: %d}
+    risk: {max_position_size: 0.1}
+"""
+
+
+def _write(path, window, stamp):
+    path.write_text(BASE % window)
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_symbol_overrides(tmp_path):
+    path = tmp_path / "settings.yaml"
+    _write(path, 30, 1)
+    s = load_settings(str(path))
+    btc = s.for_symbol("BTC-USD")
+    assert (btc.entropy_window, btc.p_threshold, btc.max_position_size) == (30, 0.045, 0.1)
+    assert s.for_symbol("SPY") is s
+
+
+def test_store_polls_file_and_keeps_last_good_version(tmp_path):
+    path = tmp_path / "settings.yaml"
+    _write(path, 30, 1)
+    store = SettingsStore(str(path))
+    assert not store.poll() and store.version == 0
+    _write(path, 40, 2)
+    assert store.poll() and store.version == 1
+    assert store.current.for_symbol("BTC-USD").entropy_window == 40
+    path.write_text("entropy: {window: [")
+    os.utime(path, ns=(3, 3))
+    assert not store.poll() and store.version == 1 and store.last_error
+    _write(path, 40, 4)
+    assert not store.poll() and store.last_error is None  # same content, no new version
+
+
+def test_running_trader_applies_reload_between_ticks(tmp_path, monkeypatch):
+    path = tmp_path / "settings.yaml"
+    _write(path, 30, 1)
+    store = SettingsStore(str(path))
+    trader = EntropyTrader(db_url=f"sqlite:///{tmp_path / 'caps.db'}", store=store)
+    spy = trader.symbol_params["SPY"]
+    assert trader.symbol_params["BTC-USD"].analyzer.window == 30
+
+    async def stream(symbol):
+        for i in range(60):
+            if symbol == "BTC-USD" and i == 40:
+                _write(path, 35, 2)
+                store.poll()
+            yield MarketTick(symbol, datetime.now(UTC), 100.0 + (i % 7), "simulated")
+            await asyncio.sleep(0)
+
+    monkeypatch.setattr(trader.pipeline, "stream_prices", stream)
+    asyncio.run(trader.run_live_trading())
+
+    assert trader.settings_version == 1
+    assert trader.symbol_params["SPY"] is not spy  # a fresh params record ...
+    assert trader.symbol_params["SPY"].analyzer is spy.analyzer  # ... reusing unchanged parts
+    assert len(trader.price_buffers["BTC-USD"]) == 60  # history survived the window change
+    with trader.db.engine.connect() as conn:
+        rows = conn.execute(
+            select(trader.db.capsules.c.payload).where(trader.db.capsules.c.symbol == "BTC-USD")
+        ).all()
+    windows = [r.payload["signal"]["window"] for r in rows]
+    assert windows == [30] * 11 + [35] * 20  # ticks 29..39, then 40..59
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading.walkforward import EntropyWalkForward, walk_forward_folds
+
+
+def _prices(n=1200, seed=4):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({"close": close}, index=pd.bdate_range("2015-01-01", periods=n))
+
+
+def test_folds_rolling_and_anchored():
+    rolling = walk_forward_folds(1000, 400, 200)
+    assert [(f.train_start, f.test_start, f.test_end) for f in rolling] == [
+        (0, 400, 600),
+        (200, 600, 800),
+        (400, 800, 1000),
+    ]
+    assert all(f.train_start == 0 for f in walk_forward_folds(1000, 400, 200, anchored=True))
+
+
+def test_out_of_sample_curve_has_no_lookahead():
+    df = _prices()
+    wf = EntropyWalkForward(train_size=400, test_size=200)
+    full = wf.run(df, n_jobs=1)
+    assert len(full.folds) == 4
+    assert full.equity_curve.index[0] == df.index[400]
+    assert full.equity_curve.iloc[0] == 100000
+    # Appending future bars must not change earlier folds' choices or returns.
+    short = wf.run(df.iloc[:1000], n_jobs=1)
+    assert [f.params for f in short.folds] == [f.params for f in full.folds[:3]]
+    pd.testing.assert_series_equal(short.oos_returns, full.oos_returns.iloc[:600])
+
+
+def test_parallel_folds_match_serial():
+    df = _prices(900)
+    wf = EntropyWalkForward(train_size=300, test_size=200)
+    a = wf.run(df, n_jobs=1)
+    b = wf.run(df, n_jobs=2)
+    pd.testing.assert_series_equal(a.equity_curve, b.equity_curve)
+
+
+def test_fold_returns_match_backtester_on_same_slice():
+    from trading.backtest import EntropyBacktester
+    from trading.walkforward import _strategy_returns
+
+    df = _prices(600)
+    params = (21, 0.045, 0.09)
+    wf = EntropyWalkForward(train_size=400, test_size=200)
+    features = wf._features(df["close"].to_numpy(), [params])
+    fold = walk_forward_folds(len(df), 400, 200)[0]
+    assert fold.train_start == 0  # trailing features over [0, hi) equal a fresh backtest
+    got = _strategy_returns(features, params, fold.train_start, fold.train_end)
+    bt = EntropyBacktester(backend="numpy", window=21, p_thresh=0.045, np_thresh=0.09)
+    ref = bt.backtest_entropy_strategy(df.iloc[: fold.train_end])
+    assert np.any(ref.positions != 0)
+    np.testing.assert_allclose(got[1:], ref.positions * ref.market_returns, atol=1e-15)
+
+
+def test_partial_and_empty_grids():
+    wf = EntropyWalkForward(param_grid={"window": (14,)})
+    assert {w for w, _, _ in wf._grid()} == {14} and len(wf._grid()) == 9
+    with pytest.raises(ValueError, match="grid"):
+        EntropyWalkForward(param_grid={"p_threshold": (0.1,), "np_threshold": (0.05,)})
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from market.types import MarketTick, to_ns
+from services.wire import TickEncoder, decode_binary, tick_frames
+
+T0 = datetime(2024, 3, 1, 12, 0, 0, 123456, tzinfo=UTC)
+
+
+class _Pipeline:
+    def __init__(self, n=20, dt=0.001, fail=None):
+        self.n, self.dt, self.fail = n, dt, fail
+
+    async def stream_prices(self, symbol):
+        for i in range(self.n):
+            yield MarketTick(symbol, T0 + timedelta(seconds=i), 100.0 + i, "simulated")
+            await asyncio.sleep(self.dt)
+        if symbol == self.fail:
+            raise ConnectionError(symbol)
+
+
+def test_encoders_roundtrip():
+    ticks = [MarketTick(s, T0, 1.5 + i, "simulated") for i, s in enumerate(["QQQ", "SPY"])]
+    enc = TickEncoder(["SPY", "QQQ"], "json")
+    assert json.loads(enc.encode_one(ticks[0])) == {
+        "symbol": "QQQ",
+        "ts": T0.isoformat(),
+        "price": 1.5,
+    }
+    assert [m["symbol"] for m in json.loads(enc.encode(ticks))] == ["QQQ", "SPY"]
+
+    enc = TickEncoder(["SPY", "QQQ"], "binary")
+    assert json.loads(enc.hello())["symbols"] == ["SPY", "QQQ"]
+    frame = enc.encode(ticks)
+    assert isinstance(frame, bytes)
+    rec = decode_binary(frame)
+    assert rec["symbol"].tolist() == [1, 0]
+    assert rec["ts_ns"].tolist() == [to_ns(T0)] * 2
+    assert rec["price"].tolist() == [1.5, 2.5]
+    assert enc.encode_one(ticks[0]) == enc.encode(ticks[:1])
+
+
+async def _take(frames, n_ticks):
+    out = []
+    async with aclosing(frames):
+        async for frame in frames:
+            assert isinstance(frame, bytes)
+            out.append(decode_binary(frame))
+            if sum(r.size for r in out) >= n_ticks:
+                return out
+
+
+def test_tick_frames_merges_symbols_and_batches():
+    def collect(flush):
+        enc = TickEncoder(["SPY", "QQQ"], "binary")
+        return asyncio.run(_take(tick_frames(_Pipeline(), enc, flush), 40))
+
+    unbatched = collect(0.0)
+    assert len(unbatched) == 40 and all(r.size == 1 for r in unbatched)
+    batched = collect(0.01)
+    assert len(batched) < 40 and sum(r.size for r in batched) == 40
+    for sym in (0, 1):
+        prices = [p for r in batched for p in r["price"][r["symbol"] == sym]]
+        assert prices == [100.0 + i for i in range(20)]
+
+
+def test_tick_frames_end_with_streams_and_surface_failures():
+    async def drain(pipeline, max_pending=4096, lag=0.0):
+        enc = TickEncoder(["SPY", "QQQ"], "binary")
+        frames = tick_frames(pipeline, enc, 0.0, max_pending)
+        out: list[bytes] = []
+        async with aclosing(frames):
+            async for frame in frames:
+                assert isinstance(frame, bytes)
+                out.append(frame)
+                await asyncio.sleep(lag)
+        return [r for f in out for r in decode_binary(f)]
+
+    assert len(asyncio.run(drain(_Pipeline(n=5)))) == 10
+    with pytest.raises(ConnectionError, match="QQQ"):
+        asyncio.run(drain(_Pipeline(n=5, fail="QQQ")))
+
+    # A consumer that lags past max_pending gets the latest tick of each symbol.
+    recs = asyncio.run(drain(_Pipeline(n=50, dt=0.0), max_pending=8, lag=0.001))
+    assert len(recs) < 100
+    for sym in (0, 1):
+        prices = [r["price"] for r in recs if r["symbol"] == sym]
+        assert prices == sorted(prices) and prices[-1] == 149.0